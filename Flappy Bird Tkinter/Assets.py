@@ -0,0 +1,242 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+
+from PIL.Image import frombytes
+from PIL.Image import new as newImage
+from PIL.Image import open as openImage
+from PIL.ImageTk import PhotoImage
+
+
+class Assets(object):
+    """
+    Class to load the images of the game only once. The resized images are kept in memory
+    and saved uncompressed on disk, so the next runs of the game do not decode and resize them again.
+    """
+
+    # Directory where the resized images are saved. If None, nothing is saved on disk
+    cache_fp = "Data/cache"
+
+    # Atlas from which the images are taken. The images that are not in it are read from their own files
+    atlas = None
+
+    # Mode and size of the original images, and images already loaded, by path and by (path, width, height)
+    __headers = {}
+    __sources = {}
+    __images = {}
+    __photoImages = {}
+
+    @classmethod
+    def clear(cls):
+        """ Method to discard all images kept in memory. The images are not closed, since they are shared
+        and may still be used, they are only no longer returned """
+
+        cls.__headers.clear()
+        cls.__sources.clear()
+        cls.__images.clear()
+        cls.__photoImages.clear()
+
+    @classmethod
+    def exists(cls, image_path):
+        """ Method to check if an image exists in the atlas or in its own file """
+
+        return bool(cls.atlas and cls.atlas.has(image_path)) or os.path.exists(image_path)
+
+    @classmethod
+    def getCachePath(cls, image_path, width, height, mode):
+        """ Returns the path of the file where the resized image is saved on disk. The path changes
+        whenever the original image is modified, so an outdated image is never used. """
+
+        name = os.path.splitext(os.path.basename(image_path))[0]
+
+        # The images of the atlas change when the atlas is built again
+        if cls.atlas and cls.atlas.has(image_path):
+            mtime = cls.atlas.mtime
+        else:
+            mtime = os.stat(image_path).st_mtime_ns
+
+        return os.path.join(cls.cache_fp, "{}-{}x{}-{}-{}.raw".format(name, width, height, mode, mtime))
+
+    @classmethod
+    def getHeader(cls, image_path):
+        """ Returns the mode and size of the original image of the path, without decoding it """
+
+        if image_path not in cls.__headers and cls.atlas and cls.atlas.has(image_path):
+            cls.__headers[image_path] = cls.atlas.getHeader(image_path)
+
+        if image_path not in cls.__headers:
+            with openImage(image_path) as image:
+                cls.__headers[image_path] = (image.mode, image.size)
+
+        return cls.__headers[image_path]
+
+    @classmethod
+    def getSource(cls, image_path):
+        """ Returns the original image (PIL.Image) of the path, opening it only once """
+
+        if image_path not in cls.__sources:
+
+            # Takes the image from the atlas, if it is there
+            if cls.atlas and cls.atlas.has(image_path):
+                image = cls.atlas.getImage(image_path)
+            else:
+                image = openImage(image_path)
+                image.load()
+
+            cls.__sources[image_path] = image
+
+        return cls.__sources[image_path]
+
+    @classmethod
+    def getImage(cls, image_path, width=None, height=None):
+        """ Returns the image (PIL.Image) of the path resized. The returned image is shared and must not be closed.
+        @param image_path: Image Directory
+        @param width: Image width
+        @param height: Image height """
+
+        key = (image_path, width, height)
+
+        if key in cls.__images:
+            return cls.__images[key]
+
+        # If the size is not complete, the size of the original image is used
+        mode, size = cls.getHeader(image_path)
+        width = width or size[0]
+        height = height or size[1]
+
+        image = cls.__loadFromDisk(image_path, width, height, mode)
+
+        # If the resized image is not on disk, it is created from the original image and saved
+        if image is None:
+            image = cls.getSource(image_path).resize([width, height])
+            cls.__saveToDisk(image_path, image)
+
+        cls.__images[key] = image
+        return image
+
+    @classmethod
+    def getPhotoImage(cls, image=None, image_path=None, width=None, height=None):
+        """ Returns a PIL.ImageTk.PhotoImage of an image resized.
+        The PhotoImages of image paths are created only once and shared.
+        @param image: Pil instance. Image.open
+        @param image_path: Image Directory
+        @param width: Image width
+        @param height: Image height """
+
+        # Images that do not come from a file are only resized
+        if image:
+            return PhotoImage(image.resize([width or image.width, height or image.height]))
+
+        if not image_path: return
+
+        key = (image_path, width, height)
+
+        if key not in cls.__photoImages:
+            cls.__photoImages[key] = PhotoImage(cls.getImage(image_path, width, height))
+
+        return cls.__photoImages[key]
+
+    @classmethod
+    def getStrip(cls, image_path, width, height, count=2):
+        """ Returns a PIL.ImageTk.PhotoImage with the image of the path resized and repeated side by side.
+        The strips are created only once and shared.
+        @param image_path: Image Directory
+        @param width: Width of each copy of the image
+        @param height: Image height
+        @param count: Number of copies of the image """
+
+        key = (image_path, width, height, count)
+
+        if key not in cls.__photoImages:
+            cls.__photoImages[key] = PhotoImage(cls.getStripImage(image_path, width, height, count))
+
+        return cls.__photoImages[key]
+
+    @classmethod
+    def getStripImage(cls, image_path, width, height, count=2):
+        """ Returns the image (PIL.Image) of the path resized and repeated side by side. The returned image is shared.
+        @param image_path: Image Directory
+        @param width: Width of each copy of the image
+        @param height: Image height
+        @param count: Number of copies of the image """
+
+        key = (image_path, width, height, count)
+
+        if key not in cls.__images:
+            image = cls.getImage(image_path, width, height)
+
+            # Images with palette are converted, so the strip keeps their colors
+            if image.mode == "P":
+                image = image.convert("RGBA")
+
+            strip = newImage(image.mode, (width * count, height))
+
+            for index in range(count):
+                strip.paste(image, (width * index, 0))
+
+            cls.__images[key] = strip
+
+        return cls.__images[key]
+
+    @classmethod
+    def useAtlas(cls, atlas):
+        """ Method to take the images from an atlas. The images already loaded are discarded.
+        @param atlas: Instance of Atlas, or None to read all the images from their own files """
+
+        cls.clear()
+        cls.atlas = atlas
+
+    @classmethod
+    def preload(cls, images=(), strips=(), max_workers=None):
+        """ Starts to decode and resize images on a pool of threads, without waiting for them.
+        Returns a list of concurrent.futures.Future, one for each image.
+        Only the PIL images are created, since the PhotoImages must be created on the thread of Tk.
+        @param images: Sequence of (image_path, width, height) passed to getImage
+        @param strips: Sequence of (image_path, width, height, count) passed to getStripImage
+        @param max_workers: Maximum number of threads. If None, it depends on the number of processors """
+
+        executor = ThreadPoolExecutor(max_workers)
+
+        futures = [executor.submit(cls.getImage, *image) for image in images]
+        futures.extend(executor.submit(cls.getStripImage, *strip) for strip in strips)
+
+        # The threads end by themselves when all the images are ready
+        executor.shutdown(wait=False)
+
+        return futures
+
+    @classmethod
+    def __loadFromDisk(cls, image_path, width, height, mode):
+        """ Returns the resized image saved on disk or None if it does not exist """
+
+        # Images with palette are not saved, since only their pixels would be written
+        if not cls.cache_fp or mode == "P": return
+
+        try:
+            with open(cls.getCachePath(image_path, width, height, mode), "rb") as file:
+                return frombytes(mode, (width, height), file.read())
+
+        except (OSError, ValueError):
+            return
+
+    @classmethod
+    def __saveToDisk(cls, image_path, image):
+        """ Saves the resized image on disk, removing the outdated versions of it """
+
+        if not cls.cache_fp or image.mode == "P": return
+
+        try:
+            if not os.path.exists(cls.cache_fp):
+                os.makedirs(cls.cache_fp)
+
+            path = cls.getCachePath(image_path, image.width, image.height, image.mode)
+
+            # Removes the images saved from older versions of the original image
+            for old in glob(path.rsplit("-", 1)[0] + "-*.raw"):
+                os.remove(old)
+
+            with open(path, "wb") as file:
+                file.write(image.tobytes())
+
+        except OSError:
+            return
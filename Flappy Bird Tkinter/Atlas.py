@@ -0,0 +1,176 @@
+import json
+import os
+import sys
+from argparse import ArgumentParser
+from threading import Lock
+
+from PIL.Image import new as newImage
+from PIL.Image import open as openImage
+
+
+class Atlas(object):
+    """
+    Class with many images packed in a single image (the atlas) and an index with the rectangle of each one,
+    so only one file is decoded when the game starts.
+
+    The index also keeps the modification time of each original image. If an original image is modified
+    after the atlas is built, it is no longer taken from the atlas, so the atlas never shows outdated images.
+    """
+
+    version = 1
+
+    def __init__(self, image_fp="Data/atlas.png", index_fp="Data/atlas.json"):
+        """
+        @param image_fp: Path of the atlas image
+        @param index_fp: Path of the JSON file with the rectangles of the images
+        """
+
+        self.image_fp = image_fp
+        self.index_fp = index_fp
+
+        # Rectangles (x, y, width, height) of the images that can be taken from the atlas, by path
+        self.sprites = {}
+        self.mode = None
+        self.mtime = None
+
+        self.__image = None
+        self.__lock = Lock()
+
+    def build(self, images_fp, padding=1):
+        """ Method to pack the images in the atlas and save the atlas image and its index
+        @param images_fp: Paths of the images
+        @param padding: Space in pixels between the images """
+
+        images = {}
+
+        for path in images_fp:
+            with openImage(path) as image:
+                images[os.path.normpath(path)] = image.convert("RGBA")
+
+        rects, size = self.pack({path: image.size for path, image in images.items()}, padding)
+
+        # Copies each image to its rectangle
+        atlas = newImage("RGBA", size)
+
+        for path, (x, y, width, height) in rects.items():
+            atlas.paste(images[path], (x, y))
+
+        # If the directory does not exist, it will be created
+        for fp in (self.image_fp, self.index_fp):
+            directory = os.path.split(fp)[0]
+
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+        atlas.save(self.image_fp)
+
+        index = {
+            "version": self.version,
+            "mode": atlas.mode,
+            "size": list(size),
+            "sprites": {
+                path: {"rect": list(rect), "mtime": os.stat(path).st_mtime_ns} for path, rect in rects.items()
+            }
+        }
+
+        with open(self.index_fp, "w") as file:
+            file.write(json.dumps(index, indent=2))
+
+        return self.load()
+
+    def getHeader(self, image_path):
+        """ Returns the mode and size of an image of the atlas, without decoding the atlas """
+
+        rect = self.sprites[os.path.normpath(image_path)]
+        return self.mode, (rect[2], rect[3])
+
+    def getImage(self, image_path):
+        """ Returns a copy (PIL.Image) of an image of the atlas. The atlas is decoded only on the first call,
+        even if several threads call this method at once """
+
+        x, y, width, height = self.sprites[os.path.normpath(image_path)]
+
+        with self.__lock:
+            if self.__image is None:
+                image = openImage(self.image_fp)
+                image.load()
+                self.__image = image
+
+        return self.__image.crop((x, y, x + width, y + height))
+
+    def has(self, image_path):
+        """ Method to check if an image can be taken from the atlas """
+
+        return os.path.normpath(image_path) in self.sprites
+
+    def load(self):
+        """ Method to read the index of the atlas. If the atlas does not exist or is invalid, it will have no images.
+        Returns the atlas itself. """
+
+        self.sprites = {}
+        self.__image = None
+
+        try:
+            with open(self.index_fp) as file:
+                index = json.loads(file.read())
+
+            self.mtime = os.stat(self.image_fp).st_mtime_ns
+
+        except (OSError, ValueError):
+            return self
+
+        if index.get("version") != self.version: return self
+
+        self.mode = index["mode"]
+
+        for path, sprite in index["sprites"].items():
+
+            # The images that were modified after the atlas was built are read from their own files
+            if os.path.exists(path) and os.stat(path).st_mtime_ns != sprite["mtime"]: continue
+
+            self.sprites[path] = tuple(sprite["rect"])
+
+        return self
+
+    @staticmethod
+    def pack(sizes, padding=1):
+        """ Returns the rectangles (x, y, width, height) of images placed in rows, from the tallest to the
+        shortest, and the size of the atlas
+        @param sizes: Dictionary with the size (width, height) of each image """
+
+        # The width of the atlas fits the widest image and makes it roughly square
+        area = sum((width + padding) * (height + padding) for width, height in sizes.values())
+        atlas_width = max(max(width for width, height in sizes.values()), int(area ** 0.5))
+
+        rects = {}
+        x = y = row_height = 0
+
+        for path in sorted(sizes, key=lambda path: sizes[path][1], reverse=True):
+            width, height = sizes[path]
+
+            # When the image does not fit in the row, a new row is started
+            if x + width > atlas_width:
+                x, y, row_height = 0, y + row_height + padding, 0
+
+            rects[path] = (x, y, width, height)
+            x += width + padding
+            row_height = max(row_height, height)
+
+        return rects, (atlas_width, y + row_height)
+
+
+if __name__ == "__main__":
+    from Settings import Settings
+
+    parser = ArgumentParser(description="Packs the images of the game in a single atlas image.")
+    parser.add_argument("--image", default=Settings.atlas_fp, help="Path of the atlas image")
+    parser.add_argument("--index", default=Settings.atlas_index_fp, help="Path of the JSON index")
+    parser.add_argument("--padding", type=int, default=1)
+    args = parser.parse_args()
+
+    atlas = Atlas(args.image, args.index).build(Settings.images_fp, args.padding)
+
+    for path, rect in sorted(atlas.sprites.items()):
+        print("{:<30} {}".format(path, rect))
+
+    sys.exit(0 if len(atlas.sprites) == len(set(Settings.images_fp)) else 1)
@@ -0,0 +1,221 @@
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from random import Random
+from statistics import median
+from time import perf_counter
+
+from Assets import Assets
+from Policies import followGap
+from Settings import Settings
+from World import World
+
+
+class Benchmark(object):
+    """
+    Class to measure the time of the hot paths of the game. The parts that use the canvas need a display
+    (it can be a virtual one, such as Xvfb) and are skipped when there is none.
+    """
+
+    def __init__(self, width=1920, height=1080, tick_rate=60, repeat=5, seed=0):
+
+        self.width = width
+        self.height = height
+        self.tick_rate = tick_rate
+        self.repeat = repeat
+        self.seed = seed
+
+        self.results = {}
+        self.skipped = []
+
+    def createWorld(self):
+        """ Method to return a new world with the size of the benchmark """
+
+        return World(self.width, self.height, tick=1000 / self.tick_rate, seed=self.seed)
+
+    def measure(self, name, function, number, setup=None):
+        """ Method to measure the time of a function, in microseconds per call
+        @param name: Name of the result
+        @param function: Callable that is measured, called without arguments
+        @param number: Number of calls in each repetition
+        @param setup: Callable executed before each call, outside the measured time """
+
+        times = []
+
+        for i in range(self.repeat):
+            total = 0
+
+            for j in range(number):
+                if setup: setup()
+
+                start = perf_counter()
+                function()
+                total += perf_counter() - start
+
+            times.append(total / number * 1e6)
+
+        self.results[name] = {"median_us": median(times), "min_us": min(times), "calls": number * self.repeat}
+        return self.results[name]
+
+    def runHeadless(self):
+        """ Method to measure the parts of the game that do not need a display """
+
+        # Resizes the tube body image to a random height, as done for each new tube without the cache
+        body = Assets.getImage(Settings.tube_fp[0])
+        rng = Random(self.seed)
+        self.measure("resize_image", lambda: body.resize([self.width // 10, rng.randint(50, self.height)]), 50)
+
+        # Advances a world played by a bot by one tick
+        world = self.createWorld()
+        rng = Random(self.seed)
+
+        def step():
+            if not world.alive: world.reset()
+            world.step(followGap(world, rng))
+
+        self.measure("world_step", step, 5000)
+
+        # Checks the collision of the bird with a tube in front of it
+        world = self.createWorld()
+
+        while world.alive and world.distance < world.width / 2 + world.min_distance:
+            world.step(followGap(world, rng))
+
+        self.measure("check_collision", world.checkCollision, 20000)
+
+        # Plays a full game of up to one minute without display
+        def game():
+            world = self.createWorld()
+
+            while world.alive and world.ticks < 60 * self.tick_rate:
+                world.step(followGap(world, rng))
+
+        self.measure("full_game", game, 1)
+
+    def runCanvas(self):
+        """ Method to measure the parts of the game that draw in the canvas """
+
+        try:
+            from tkinter import Tk
+            root = Tk()
+        except Exception as error:
+            self.skipped.append("canvas: {}".format(error))
+            return
+
+        from Background import Background
+        from Bird import Bird
+        from Tubes import Tubes
+
+        root.withdraw()
+
+        try:
+            world = self.createWorld()
+            background = Background(root, self.width, self.height, fp=Settings.background_fp)
+            bird = Bird(background, world, fp=Settings.bird_fp)
+            tubes = Tubes(background, world, fp=Settings.tube_fp)
+            rng = Random(self.seed)
+
+            # Creates a PhotoImage of the tube body resized to a random height
+            width, height = world.getPixelSize(world.tube_width, world.mouth_height)
+            body = Assets.getImage(Settings.tube_fp[0], width, height)
+            self.measure(
+                "get_photo_image",
+                lambda: Assets.getPhotoImage(image=body, width=width, height=rng.randint(50, self.height)),
+                50
+            )
+
+            # Creates the images of a new tube, hiding the previous one so the pool does not grow
+            world.createNewTubes()
+            tube = world.tubes[-1]
+
+            self.measure("create_new_tubes", lambda: tubes.createNewTubes(tube), 500, tubes.deleteAll)
+            tubes.deleteAll()
+
+            # Moves the tubes of a world with all the tubes on the screen
+            while world.alive and world.distance < world.width * 2:
+                world.step(followGap(world, rng))
+                tubes.run()
+
+            alpha = iter(range(10 ** 9))
+            self.measure("tubes_move", lambda: tubes.move(next(alpha) % 10 / 10), 5000)
+
+            # Scrolls the background
+            self.measure("background_run", lambda: background.run(world.toPixels(world.tube_speed)), 5000)
+
+            # Draws the bird and the tubes between two ticks
+            self.measure("render_frame", lambda: (bird.run(next(alpha) % 10 / 10), tubes.run(0.5)), 5000)
+
+            root.update()
+
+        finally:
+            root.destroy()
+
+    def run(self, canvas=True):
+        """ Method to run all the benchmarks and return the report """
+
+        self.runHeadless()
+
+        if canvas:
+            self.runCanvas()
+
+        return self.report()
+
+    def report(self):
+        """ Method to return the results with information about the machine """
+
+        return {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": {"width": self.width, "height": self.height, "tick_rate": self.tick_rate},
+            "results": self.results,
+            "skipped": self.skipped
+        }
+
+    @staticmethod
+    def compare(baseline, current, threshold=0.1):
+        """ Returns a list of (name, baseline, current, ratio, regression) for the benchmarks present in both reports.
+        A regression is a median time greater than the baseline by more than the threshold (0.1 = 10%). """
+
+        comparison = []
+
+        for name, result in current["results"].items():
+            if name not in baseline["results"]: continue
+
+            before = baseline["results"][name]["median_us"]
+            ratio = result["median_us"] / before if before else float("inf")
+            comparison.append((name, before, result["median_us"], ratio, ratio > 1 + threshold))
+
+        return comparison
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Measures the hot paths of the game and compares them with a baseline.")
+    parser.add_argument("--output", default=None, help="JSON file where the results are saved")
+    parser.add_argument("--baseline", default=None, help="JSON file with the results used for comparison")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Tolerated slowdown (0.1 = 10%%)")
+    parser.add_argument("--headless", action="store_true", help="Skips the benchmarks that need a display")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    report = Benchmark(repeat=args.repeat).run(canvas=not args.headless)
+
+    for name, result in report["results"].items():
+        print("{:<20} {:>12.2f} us".format(name, result["median_us"]))
+
+    for reason in report["skipped"]:
+        print("Skipped {}".format(reason))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            comparison = Benchmark.compare(json.loads(file.read()), report, args.threshold)
+
+        for name, before, after, ratio, regression in comparison:
+            print("{:<20} {:>12.2f} -> {:>12.2f} us ({:+.1%}){}".format(
+                name, before, after, ratio - 1, "  REGRESSION" if regression else ""))
+
+        sys.exit(1 if any(item[4] for item in comparison) else 0)
@@ -0,0 +1,16 @@
+def overlaps(first, second):
+    """ Returns True if the rectangles overlap. Like Canvas.find_overlapping, touching edges count as a collision. """
+
+    return first[0] <= second[2] and second[0] <= first[2] and first[1] <= second[3] and second[1] <= first[3]
+
+
+def shrink(box, margins):
+    """ Returns the rectangle reduced by the margins (left, top, right, bottom) """
+
+    return box[0] + margins[0], box[1] + margins[1], box[2] - margins[2], box[3] - margins[3]
+
+
+def outside(box, height, tolerance=20):
+    """ Returns True if the rectangle has crossed the top or bottom edge of the screen by the tolerance in pixels """
+
+    return box[3] >= height + tolerance or box[1] <= -tolerance
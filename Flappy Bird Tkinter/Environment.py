@@ -0,0 +1,251 @@
+import numpy as np
+
+from World import World
+
+
+class Environment(object):
+    """
+    Class to simulate many independent games at once with NumPy, with an interface similar to the Gym vector
+    environments. Each game has its own bird and its own tubes, which follow the same rules as the World class.
+
+    The observation of each game is (bird Y, bird speed, distance X to the next tube, Y of the mouth of the
+    next top tube, Y of the mouth of the next bottom tube), divided by the size of the screen or by the maximum speed.
+    The action of each game is 1 to jump and 0 to do nothing.
+    """
+
+    # Rewards given for passing a tube, for each tick alive and for dying
+    reward_tube = 1.0
+    reward_alive = 0.0
+    reward_death = -1.0
+
+    # Size of an observation
+    observation_size = 5
+
+    def __init__(self, num_envs, width=1920, height=1080, tick_rate=60):
+
+        if num_envs < 1: raise ValueError("The num_envs argument must be greater than zero.")
+
+        self.num_envs = num_envs
+
+        # A world is created only to get the sizes and speeds, so the rules are the same as in the game
+        self.world = World(width, height, tick=1000 / tick_rate)
+
+        # Maximum number of tubes that can exist at the same time in a game
+        self.__slots = self.world.getMaxTubes()
+
+        self.__rng = np.random.default_rng()
+
+        # Array with the Y positions of the top tubes that are created in each game, in order. When
+        # it is None or all of them have been used, the positions are chosen randomly
+        self.course = None
+
+        self.__allocate()
+
+    def __allocate(self):
+        """ Method to create the arrays with the state of all games """
+
+        n, k = self.num_envs, self.__slots
+
+        # Bird state
+        self.bird_y = np.zeros(n)
+        self.velocity = np.zeros(n)
+        self.climb_left = np.zeros(n)
+
+        # Tubes state. Each game has a fixed number of slots that are reused in order
+        self.tube_offset = np.zeros((n, k))
+        self.tube_height = np.zeros((n, k))
+        self.tube_bottom = np.zeros((n, k))
+        self.tube_valid = np.zeros((n, k), dtype=bool)
+        self.tube_scored = np.zeros((n, k), dtype=bool)
+        self.next_slot = np.zeros(n, dtype=np.int64)
+
+        # Index in the course of the next tube of each game
+        self.course_index = np.zeros(n, dtype=np.int64)
+
+        # Distance scrolled by the world and distance since the last tube was created
+        self.distance = np.zeros(n)
+        self.spawn_distance = np.zeros(n)
+
+        # Game state
+        self.score = np.zeros(n, dtype=np.int64)
+        self.ticks = np.zeros(n, dtype=np.int64)
+
+    def __resetGames(self, mask):
+        """ Method to put the games of the mask back in their initial state """
+
+        self.bird_y[mask] = self.world.height // 2
+        self.velocity[mask] = 0
+        self.climb_left[mask] = 0
+
+        self.tube_valid[mask] = False
+        self.tube_scored[mask] = False
+        self.next_slot[mask] = 0
+        self.course_index[mask] = 0
+
+        self.distance[mask] = 0
+        self.spawn_distance[mask] = 0
+
+        self.score[mask] = 0
+        self.ticks[mask] = 0
+
+    def observe(self):
+        """ Method to return the observations of all games as an array (num_envs, observation_size) """
+
+        world = self.world
+
+        # The next tube is the nearest tube that the bird has not yet passed
+        x = self.tube_offset - self.distance[:, None]
+        ahead = self.tube_valid & (x + world.tube_width // 2 > world.bird_x - world.bird_width / 2)
+        index = np.argmin(np.where(ahead, x, np.inf), axis=1)
+        rows = np.arange(self.num_envs)
+        found = ahead[rows, index]
+
+        # If there is no tube ahead yet, the next one will be created at the right edge, centered on the screen
+        next_x = np.where(found, x[rows, index], world.width + world.tube_width)
+        next_height = np.where(found, self.tube_height[rows, index], world.height / 2 - world.bird_height)
+        next_bottom = np.where(found, self.tube_bottom[rows, index], world.height / 2 + world.bird_height)
+
+        observation = np.empty((self.num_envs, self.observation_size), dtype=np.float32)
+        observation[:, 0] = self.bird_y / world.height
+        observation[:, 1] = self.velocity / world.decends
+        observation[:, 2] = (next_x - world.bird_x) / world.width
+        observation[:, 3] = next_height / world.height
+        observation[:, 4] = next_bottom / world.height
+
+        return observation
+
+    def reset(self, seed=None, course=None):
+        """ Method to restart all games. Returns the observations.
+        @param seed: Seed of the random generator of the tubes
+        @param course: Sequence with the Y positions of the top tubes created in each game, in order,
+        like the course of a World. When all of them have been used, the positions are chosen randomly """
+
+        self.__rng = np.random.default_rng(seed)
+        self.course = None if course is None else np.asarray(course)
+        self.__resetGames(np.ones(self.num_envs, dtype=bool))
+
+        return self.observe()
+
+    def step(self, actions):
+        """ Method to advance all games by one tick. The games that end are restarted automatically.
+        Returns (observations, rewards, dones, info), where info has the final "score" and "ticks" of each game.
+        @param actions: Array with 1 for the games where the bird jumps and 0 for the others """
+
+        world = self.world
+        jump = np.asarray(actions).astype(bool).reshape(self.num_envs)
+
+        self.ticks += 1
+
+        # A jump gives the bird an upward speed until it climbs the ascent limit
+        self.velocity[jump] = -world.jump_velocity
+        self.climb_left[jump] = world.climbsUp
+
+        # Move the birds up while the ascent limit of the jump has not been reached
+        rising = self.climb_left > 0
+        climb = np.minimum(-self.velocity * world.descend_scale, self.climb_left)
+        self.bird_y -= np.where(rising, climb, 0)
+        self.climb_left -= np.where(rising, climb, 0)
+
+        # At the top of the jump the bird stops and starts to fall
+        self.velocity[rising & (self.climb_left <= 0)] = 0
+
+        # As long as the bird has not reached its maximum speed, the speed will increase
+        falling = ~rising
+        accelerate = falling & (self.velocity < world.decends)
+        self.velocity[accelerate] += world.acceleration * world.descend_scale
+        self.bird_y += np.where(falling, self.velocity * world.descend_scale, 0)
+
+        # Removes the tubes that have left the screen
+        x = self.tube_offset - self.distance[:, None]
+        self.tube_valid &= x + world.tube_width // 2 > 0
+
+        # Creates a new tube in the games where the last one is far enough, otherwise increases the distance
+        spawn = self.spawn_distance >= world.min_distance
+        self.spawn_distance[~spawn] += world.tube_speed
+        self.__createNewTubes(spawn)
+
+        # Moves all tubes
+        self.distance += world.tube_speed
+
+        # Checks if the birds have passed any tube
+        x = self.tube_offset - self.distance[:, None]
+        passed = x + world.tube_width // 2 <= world.bird_x - world.bird_width / 2
+        passed &= self.tube_valid & ~self.tube_scored
+        self.tube_scored |= passed
+        scored = passed.sum(axis=1)
+        self.score += scored
+
+        dones = self.__checkCollision(x)
+
+        rewards = scored * self.reward_tube + self.reward_alive
+        rewards = np.where(dones, self.reward_death, rewards).astype(np.float32)
+
+        info = {"score": self.score.copy(), "ticks": self.ticks.copy()}
+
+        # Restarts the games that have ended
+        if dones.any():
+            self.__resetGames(dones)
+
+        return self.observe(), rewards, dones, info
+
+    def __checkCollision(self, x):
+        """ Returns a boolean array with the games where the bird has crossed the edge of the screen or hit a tube """
+
+        world = self.world
+        margins = world.hitbox_margins
+
+        # Rectangle occupied by the bird image
+        x1 = world.bird_x - world.bird_width // 2
+        y1 = self.bird_y - world.bird_height // 2
+        y2 = y1 + world.bird_height
+
+        # If the bird has crossed the bottom or top edge of the screen, it will be declared dead
+        dead = (y2 >= world.height + 20) | (y1 <= -20)
+
+        # Gives x pixels bird a margin of error
+        bx1, bx2 = x1 + margins[0], x1 + world.bird_width - margins[2]
+        by1, by2 = y1 + margins[1], y2 - margins[3]
+
+        # Rectangles of the tubes
+        tx1 = x - world.tube_width // 2
+        tx2 = tx1 + world.tube_width
+        top = self.tube_height + world.mouth_height // 2
+        bottom = self.tube_bottom - world.mouth_height // 2
+
+        # The bird dies if it overlaps horizontally a tube and is above the top mouth or below the bottom mouth
+        horizontal = self.tube_valid & (bx1 <= tx2) & (tx1 <= bx2)
+        vertical = (by1[:, None] <= top) | (bottom <= by2[:, None])
+
+        return dead | (horizontal & vertical).any(axis=1)
+
+    def __createNewTubes(self, mask):
+        """ Method to create a new tube just after the right edge of the screen in the games of the mask """
+
+        world = self.world
+        games = np.flatnonzero(mask)
+
+        if not len(games): return
+
+        slots = self.next_slot[games]
+
+        # Sets a Y position for the tube randomly respecting the same rules of the World
+        height = self.__rng.integers(
+            world.mouth_height // 2, world.height - (world.bird_height * 2) - world.mouth_height, size=len(games),
+            endpoint=True
+        )
+
+        # Gets the Y position of the tube from the course, in the games that have not used all of it
+        if self.course is not None:
+            index = self.course_index[games]
+            inside = index < len(self.course)
+            height[inside] = self.course[index[inside]]
+            self.course_index[games] += 1
+
+        self.tube_offset[games, slots] = world.width + world.tube_width + self.distance[games]
+        self.tube_height[games, slots] = height
+        self.tube_bottom[games, slots] = height + (world.bird_height * 2) + world.mouth_height - 1
+        self.tube_valid[games, slots] = True
+        self.tube_scored[games, slots] = False
+
+        self.next_slot[games] = (slots + 1) % self.__slots
+        self.spawn_distance[games] = 0
@@ -1,30 +1,55 @@
 __author__ = "Vipul Kumar"
 __version__ = "1.0"
 
-import os.path
+import logging
+import os
 from datetime import timedelta
-from time import time
-from tkinter import Tk, Button
+from random import getrandbits
+from time import perf_counter, time
+from tkinter import Tk, Button, Label
 
+from Assets import Assets
+from Atlas import Atlas
 from Background import Background
 from Bird import Bird
+from GameLoop import GameLoop
+from Governor import Governor
+from Leaderboard import Leaderboard
+from Profiler import Overlay, Profiler
+from Replay import Replay
 from Settings import Settings
+from Simulation import Simulation
 from Tubes import Tubes
+from World import World
+
+log = logging.getLogger("Flappy Bird")
 
 
 class App(Tk, Settings):
 
     # Private variables and internal adjustments
-    __background_animation_speed = 720
     __bestScore = 0
-    __bird_descend_speed = 38.4
-    __buttons = []
+    __callback = None
+    __controller = None
+    __error = None
+    __frame_ticks = 0
+    __governor = None
+    __paused = None
+    __playback = None
     __playing = False
+    __replay = None
     __score = 0
+    __snapshot = None
     __time = "%H:%M:%S"
 
     def __init__(self):
 
+        # Time in which the game started to be created, used to measure the time until the first frame
+        self.__created = perf_counter()
+
+        # Items of the menu buttons in the background
+        self.__buttons = []
+
         Tk.__init__(self)
         self.setOptions()
 
@@ -45,50 +70,25 @@ class App(Tk, Settings):
         self.attributes("-fullscreen", self.window_fullscreen)
         self["bg"] = "black"
 
+        # Takes the images from the atlas, if it is enabled and has been built. The images that are not in it
+        # are read from their files
+        if self.use_atlas:
+            Assets.useAtlas(Atlas(self.atlas_fp, self.atlas_index_fp).load())
+
         # Check for in-game images
         for file in self.images_fp:
-            if not os.path.exists(file):
+            if not Assets.exists(file):
                 raise FileNotFoundError("The following file was not found:\n{}".format(file))
 
-        # Press the image of the button to start the game
-        self.__startButton_image = Background.getPhotoImage(
-            image_path=self.startButton_fp,
-            width=(self.__width // 100) * self.button_width,
-            height=(self.__height // 100) * self.button_height,
-            closeAfter=True
-        )[0]
-
-        # Press the image of the button to exit the game
-        self.__exitButton_image = Background.getPhotoImage(
-            image_path=self.exitButton_fp,
-            width=(self.__width // 100) * self.button_width,
-            height=(self.__height // 100) * self.button_height,
-            closeAfter=True
-        )[0]
-
-        # Uploads the game title image
-        self.__title_image = Background.getPhotoImage(
-            image_path=self.title_fp,
-            width=(self.__width // 100) * self.title_width,
-            height=(self.__height // 100) * self.title_height,
-            closeAfter=True
-        )[0]
-
-        # Uploads the game scoreboard image
-        self.__scoreboard_image = Background.getPhotoImage(
-            image_path=self.scoreboard_fp,
-            width=(self.__width // 100) * self.scoreboard_width,
-            height=(self.__height // 100) * self.scoreboard_height,
-            closeAfter=True
-        )[0]
+        # Creates the world that keeps the state of the game
+        self.__world = self.createWorld()
 
-        # Sets the speed of the background animation based on the width of the window
-        self.__background_animation_speed //= self.__width / 100
-        self.__background_animation_speed = int(self.__background_animation_speed)
+        # Starts to decode and resize all the images of the game on other threads
+        self.__assets = Assets.preload(self.getImageSizes(), [(self.background_fp, self.__width, self.__height, 2)])
 
-        # Sets the speed of descent of the bird based on the height of the window
-        self.__bird_descend_speed //= self.__height / 100
-        self.__bird_descend_speed = int(self.__bird_descend_speed)
+        # Shows a message while the images are loaded
+        self.__splash = Label(self, text="Loading...", bg="black", fg=self.text_fill, font=(self.text_font, 30))
+        self.__splash.place(relx=0.5, rely=0.5, anchor="center")
 
     def changeFullscreenOption(self, event=None):
         """
@@ -106,14 +106,107 @@ class App(Tk, Settings):
         # Saves the player's best score before leaving the game
         self.saveScore()
 
+        # Closes the trace of the frames and shows the latency of the key presses of all the games
+        self.__profiler.close()
+        latency = self.__profiler.latencies["total"]
+
+        if latency.count:
+            log.info("Input latency (ms): %s", ", ".join("{} {}".format(*row) for row in latency.rows() if row[1]))
+
         # Tries to stop the processes
         try:
+            self.__loop.stop()
             self.__background.stop()
             self.__bird.kill()
             self.__tubes.stop()
         finally:
             quit()
 
+    def createGame(self):
+        """
+        Method to create all the initial graphical part of the game
+        """
+
+        # self.createMenuButtons()
+        self.loadScore()
+
+        # Creates the game background
+        self.__background = Background(self, self.__width, self.__height, fp=self.background_fp)
+
+        # Focuses on the background so you can define the events
+        self.__background.focus_force()
+        # Sets event to change window mode to "fullscreen" or "window"
+        self.__background.bind(self.window_fullscreen_event, self.changeFullscreenOption)
+        # Sets event to start the game
+        self.__background.bind(self.window_start_event, self.start)
+        # Sets event to exit the game
+        self.__background.bind(self.window_exit_event, self.close)
+
+        # Creates the profiler that measures each part of the game and the overlay that shows its statistics
+        self.__profiler = Profiler(trace_fp=self.trace_fp, counter=lambda: len(self.__background.find_all()))
+        self.__overlay = Overlay(self.__background, self.__profiler)
+
+        # Sets event to show or hide the overlay
+        self.__background.bind(self.overlay_event, self.__overlay.toggle)
+
+        # Sets event to pause or resume the game, which is also paused when the window is hidden or loses the focus
+        self.__background.bind(self.pause_event, self.togglePause)
+        self.__background.bind("<FocusOut>", self.suspend)
+        self.bind("<Unmap>", self.suspend)
+
+        # Defines a method if the user closes the game window
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Packages the background object
+        self.__background.pack()
+
+        # Create a button to start the game and a button to exit the game. They are shown again after each game
+        self.__startButton = Button(
+            self, image=self.__startButton_image, bd=0, command=self.start, cursor=self.button_cursor,
+            bg=self.button_bg, activebackground=self.button_activebackground
+        )
+        self.__exitButton = Button(
+            self, image=self.__exitButton_image, bd=0, command=self.close, cursor=self.button_cursor,
+            bg=self.button_bg, activebackground=self.button_activebackground
+        )
+
+        # Create so-how buttons from the game menu
+        self.createMenuButtons()
+
+        # Creates image of the game title
+        self.createTitleImage()
+
+        # Creates the loop that draws the game, while the ticks of the world are executed on another thread
+        self.__loop = GameLoop(
+            self, self.step, self.render, frame_rate=self.getFrameRate(), interpolate=self.high_refresh_rate
+        )
+
+        # Create sit-in the game
+        self.__bird = Bird(self.__background, self.__world, fp=self.bird_fp)
+
+        # Sets event to make the bird rise. It is bound only once and forwarded to the bird of the current game,
+        # since each binding of a Python function creates a Tcl command that keeps it alive
+        self.__background.bind(self.bird_event, self.__profiler.wrap("bird.jumps", self.jump))
+
+        if self.performance_overlay:
+            self.__overlay.show()
+
+        # Creates the governor that changes the performance preset based on the time of the frames
+        if self.performance_governor:
+            presets = list(self.performance_presets)
+            level = presets.index(self.performance_preset) if self.performance_preset in presets else 0
+
+            self.__governor = Governor(
+                [(name, 1000 / self.getFrameRate(name)) for name in presets], level
+            )
+
+    def createWorld(self):
+        """
+        Method to return a new world with the size of the window and the tick rate of the settings
+        """
+
+        return World(self.__width, self.__height, tick=1000 / self.tick_rate)
+
     def createMenuButtons(self):
         """
         Method for creating menu buttons
@@ -123,28 +216,16 @@ class App(Tk, Settings):
         width = (self.__width // 100) * self.button_width
         height = (self.__height // 100) * self.button_height
 
-        # Create a button to start the game
-        startButton = Button(
-            self, image=self.__startButton_image, bd=0, command=self.start, cursor=self.button_cursor,
-            bg=self.button_bg, activebackground=self.button_activebackground
-        )
-        # Places the button inside the background (Canvas)
+        # Places the buttons inside the background (Canvas)
         self.__buttons.append(
             self.__background.create_window((self.__width // 2) - width // 1.5,
                                             int(self.__height / 100 * self.button_position_y),
-                                            window=startButton))
+                                            window=self.__startButton))
 
-        # Create a button to exit the game
-        exitButton = Button(
-            self, image=self.__exitButton_image, bd=0, command=self.close, cursor=self.button_cursor,
-            bg=self.button_bg, activebackground=self.button_activebackground
-        )
-
-        # Places the button inside the background (Canvas)
         self.__buttons.append(
             self.__background.create_window((self.__width // 2) + width // 1.5,
                                             int(self.__height / 100 * self.button_position_y),
-                                            window=exitButton))
+                                            window=self.__exitButton))
 
     def createScoreBoard(self):
         """
@@ -216,22 +297,67 @@ class App(Tk, Settings):
         # Clears the list of buttons
         self.__buttons.clear()
 
+    def getBackground(self):
+        """
+        Method to return the background of the game
+        """
+
+        return self.__background
+
+    def getWorld(self):
+        """
+        Method to return the world of the current or of the last game
+        """
+
+        return self.__world
+
+    def getImageSizes(self):
+        """
+        Method to return a list with the path, width and height of each image of the game, except the background
+        """
+
+        world = self.__world
+        button = ((self.__width // 100) * self.button_width, (self.__height // 100) * self.button_height)
+
+        return [
+            (self.startButton_fp, *button),
+            (self.exitButton_fp, *button),
+            (self.title_fp, (self.__width // 100) * self.title_width, (self.__height // 100) * self.title_height),
+            (self.scoreboard_fp, (self.__width // 100) * self.scoreboard_width,
+             (self.__height // 100) * self.scoreboard_height),
+            (self.bird_fp, *world.getPixelSize(world.bird_width, world.bird_height)),
+            (self.tube_fp[0], *world.getPixelSize(world.tube_width, world.mouth_height)),
+            (self.tube_fp[1], *world.getPixelSize(world.tube_width, world.mouth_height))
+        ]
+
     def gameOver(self):
         """
         Endgame method
         """
 
         # Calculates the time played in seconds and then formats it
-        self.__time = int(time() - self.__time)
-        self.__time = str(timedelta(seconds=self.__time))
+        duration = time() - self.__time
+        self.__time = str(timedelta(seconds=int(duration)))
 
-        # Stops background animation and tube animation
+        # Stops the game loop, the background animation and the tube animation
+        self.__loop.stop()
         self.__background.stop()
         self.__tubes.stop()
 
         # Declares that the game is no longer running
         self.__playing = False
 
+        # Writes the frames of the game in the trace file
+        self.__profiler.close()
+
+        # Saves the replay and the result of the game, unless it was itself a replay
+        if self.__playback:
+            self.__playback = None
+        else:
+            self.__replay.finish(self.__world)
+            self.saveReplay()
+            self.__leaderboard.add(self.__score, duration, self.__world.seed, self.__world.ticks)
+
         # Creates the started buttons
         self.createMenuButtons()
 
@@ -241,6 +367,27 @@ class App(Tk, Settings):
         # Creates picture of the scoreboard and shows the information of the past game
         self.createScoreBoard()
 
+    def isPlaying(self):
+        """
+        Method to check if a game is running
+        """
+
+        return self.__playing
+
+    def isPaused(self):
+        """
+        Method to check if the game is paused
+        """
+
+        return self.__paused is not None
+
+    def jump(self, event=None):
+        """
+        Method to make the bird of the current game jump
+        """
+
+        self.__bird.jumps(event)
+
     def increaseScore(self):
         """
         Method to increase the score of the player's current game
@@ -250,70 +397,148 @@ class App(Tk, Settings):
         if self.__score > self.__bestScore:
             self.__bestScore = self.__score
 
-    def init(self):
+    def init(self, callback=None):
         """
-        Method to start the program itself, creating all the initial graphical part of the game
+        Method to start the program itself. The initial graphical part of the game is created
+        as soon as the images are loaded, while the main loop of Tk is running.
+        @param callback: Callable executed after the game is created
         """
 
-        # self.createMenuButtons()
-        self.loadScore()
+        self.__callback = callback
+        self.after(10, self.waitAssets)
 
-        # Creates the game background
-        self.__background = Background(
-            self, self.__width, self.__height, fp=self.background_fp, animation_speed=self.__background_animation_speed
-        )
+    def mainloop(self, n=0):
+        """
+        Method to run the main loop of Tk. If the game could not be created, its error is raised when the loop ends
+        """
 
-        # Focuses on the background so you can define the events
-        self.__background.focus_force()
-        # Sets event to change window mode to "fullscreen" or "window"
-        self.__background.bind(self.window_fullscreen_event, self.changeFullscreenOption)
-        # Sets event to start the game
-        self.__background.bind(self.window_start_event, self.start)
-        # Sets event to exit the game
-        self.__background.bind(self.window_exit_event, self.close)
+        Tk.mainloop(self, n)
 
-        # Defines a method if the user closes the game window
-        self.protocol("WM_DELETE_WINDOW", self.close)
+        if self.__error:
+            raise self.__error
 
-        # Packages the background object
-        self.__background.pack()
+    def loadImages(self):
+        """
+        Method to create the images of the menu. The images are already decoded and resized, so only
+        the PhotoImages are created.
+        """
 
-        # Create so-how buttons from the game menu
-        self.createMenuButtons()
+        sizes = self.getImageSizes()
 
-        # Creates image of the game title
-        self.createTitleImage()
+        # Press the image of the button to start and to exit the game
+        self.__startButton_image = Assets.getPhotoImage(image_path=sizes[0][0], width=sizes[0][1], height=sizes[0][2])
+        self.__exitButton_image = Assets.getPhotoImage(image_path=sizes[1][0], width=sizes[1][1], height=sizes[1][2])
 
-        # Create sit-in the game
-        self.__bird = Bird(
-            self.__background, self.gameOver, self.__width, self.__height,
-            fp=self.bird_fp, event=self.bird_event, descend_speed=self.__bird_descend_speed
-        )
+        # Uploads the game title image
+        self.__title_image = Assets.getPhotoImage(image_path=sizes[2][0], width=sizes[2][1], height=sizes[2][2])
+
+        # Uploads the game scoreboard image
+        self.__scoreboard_image = Assets.getPhotoImage(image_path=sizes[3][0], width=sizes[3][1], height=sizes[3][2])
 
     def loadScore(self):
         """
-        Method to load player score
+        Method to open the leaderboard and load player score
         """
 
-        # Tries to load the user's score
-        try:
-            file = open(self.score_fp)
-            self.__bestScore = int(file.read(), 2)
-            file.close()
+        self.__leaderboard = Leaderboard(self.leaderboard_fp)
+        self.__bestScore = self.__leaderboard.best()
+
+        # If the leaderboard is new, the best score of the old score file is imported as a game
+        if not self.__leaderboard.count() and os.path.exists(self.score_fp):
+            try:
+                with open(self.score_fp) as file:
+                    score = int(file.read(), 2)
+            except (OSError, ValueError):
+                return
+
+            self.__leaderboard.add(score, 0, timestamp=os.stat(self.score_fp).st_mtime)
+            self.__bestScore = score
+
+    def pause(self, event=None):
+        """
+        Method to pause the game. The timer of the game loop is cancelled and the simulation sleeps,
+        so the game does not use the processor until it is resumed
+        """
+
+        if not self.__playing or self.__paused is not None: return
+
+        # Saves the time in which the game was paused, so it is not counted in the time played
+        self.__paused = time()
+        self.__loop.pause()
+
+        # Shows a message in the center of the window
+        self.__background.create_text(
+            self.__width // 2, self.__height // 2, text="Paused", fill=self.text_fill,
+            font=(self.text_font, 30), tags="paused"
+        )
+
+        log.info("Game paused")
+
+    def resume(self, event=None):
+        """
+        Method to resume the paused game
+        """
 
-        # If this is not possible, a file will be created to save the
-        except:
-            file = open(self.score_fp, 'w')
-            file.write(bin(self.__bestScore))
-            file.close()
+        if self.__paused is None: return
+
+        # The time paused is not counted in the time played
+        self.__time += time() - self.__paused
+        self.__paused = None
+
+        self.__background.delete("paused")
+
+        # Discards the jumps pressed while paused and the time paused in the frame statistics
+        self.__bird.consumeJump(False)
+        self.__profiler.skip()
+        self.__loop.resume()
+
+        log.info("Game resumed")
 
     def saveScore(self):
         """
-        Method to save player score
+        Method to write the games that have not yet been saved and close the leaderboard
+        """
+
+        self.__leaderboard.close()
+
+    def setController(self, controller):
+        """
+        Method to play the next games automatically
+        @param controller: Callable that receives the World and returns True to jump, or None to let the player play.
+        It is called on the thread of the simulation
+        """
+
+        if controller is not None and not callable(controller): raise TypeError(
+            "The controller argument must be a callable object.")
+
+        self.__controller = controller
+
+    def setPreset(self, name):
+        """
+        Method to change the performance preset during the game. The tick rate of the world changes on the next game.
+        @param name: Name of the preset in performance_presets
+        """
+
+        self.applyPreset(name)
+
+        log.info("Performance preset changed to %s", name)
+
+        # Applies the settings that can change at once
+        self.__loop.frame = 1 / self.getFrameRate()
+        self.__background.tubeCache.size = self.tube_cache_size
+
+    def suspend(self, event=None):
         """
+        Method to pause the game when the window is hidden or loses the focus
+        """
+
+        # Ignores the events of the widgets inside the window
+        if event and event.widget not in (self, self.__background): return
+
+        # Games played by a controller or by a replay do not need the player, so they are not paused
+        if self.__controller or self.__playback: return
 
-        with open(self.score_fp, 'w') as file:
-            file.write(bin(self.__bestScore))
+        self.pause()
 
     def start(self, event=None):
         """
@@ -333,28 +558,187 @@ class App(Tk, Settings):
         # Restarts the background
         self.__background.reset()
 
-        # Initializes background animation if True
-        if self.background_animation:
-            self.__background.run()
+        # Puts the world back in its initial state, with the seed of the replay or with a new seed
+        seed = self.__playback.seed if self.__playback else getrandbits(32)
 
-        # Create a bird in the game
-        self.__bird = Bird(
-            self.__background, self.gameOver, self.__width, self.__height,
-            fp=self.bird_fp, event=self.bird_event, descend_speed=self.__bird_descend_speed
-        )
+        # If the tick rate has been changed by a performance preset, a world with the new tick rate is created
+        if self.__world.tick != 1000 / self.tick_rate:
+            self.__world = self.createWorld()
+
+        self.__world.reset(seed)
+        self.__snapshot = self.__world.snapshot()
+
+        # Starts recording the game
+        self.__replay = Replay(seed, self.__width, self.__height, self.tick_rate)
+
+        # Create a bird in the game and focuses on the background, which receives its jumps
+        self.__bird = Bird(self.__background, self.__world, fp=self.bird_fp)
+        self.__background.focus_force()
 
         # Create tubes in the game
-        self.__tubes = Tubes(
-            self.__background, self.__bird, self.increaseScore, self.__width, self.__height,
-            fp=self.tube_fp, animation_speed=self.__background_animation_speed
-        )
+        self.__tubes = Tubes(self.__background, self.__world, fp=self.tube_fp, cache_size=self.tube_cache_size)
 
-        # Initializes bird and tubes animation
-        self.__bird.start()
-        self.__tubes.start()
+        # Discards the frames of the previous game
+        self.__profiler.reset()
+        self.__frame_ticks = 0
+
+        # Declares that the game is running and starts the game loop with a new simulation of the world
+        self.__playing = True
+        self.__loop.start(Simulation(
+            self.__world, self.control, self.tick_rate * self.simulation_speed, self.max_step
+        ))
+
+    def togglePause(self, event=None):
+        """
+        Method to pause or resume the game
+        """
+
+        self.resume() if self.__paused is not None else self.pause()
+
+    def control(self, world):
+        """
+        Method that returns if the bird jumps in the next tick of the world. It runs on the thread of the simulation.
+        @param world: World that will be advanced
+        """
+
+        # Gets the jump requested by the player, the jump of the replay being played or of the controller
+        if self.__playback:
+            self.__bird.consumeJump(False)
+            jump = self.__playback.jumpAt(world.ticks)
+        elif self.__controller:
+            self.__bird.consumeJump(False)
+            jump = self.__controller(world)
+        else:
+            jump = self.__bird.consumeJump()
+
+        # Records the tick of the jump
+        if jump:
+            self.__replay.record(world.ticks)
+
+        return jump
+
+    def step(self, snapshot):
+        """
+        Method to receive the state of the world after a tick. Returns False when the game is over.
+        @param snapshot: Snapshot of the world published by the simulation
+        """
+
+        self.__frame_ticks += 1
+        self.__snapshot = snapshot
+        self.__profiler.add("world.step", snapshot.step_time)
+
+        # Scores if the bird has passed a tube
+        while self.__score < snapshot.score:
+            self.increaseScore()
+
+        # If the bird is dead, the game is over
+        if not snapshot.alive:
+            self.render()
+            self.gameOver()
+            return False
+
+    def playReplay(self, replay):
+        """
+        Method to play a replay in real time
+        @param replay: Instance of Replay recorded with the same aspect ratio of the window and tick rate
+        """
+
+        # The replay is not played while a game is running, so it does not take the jumps of that game
+        if self.__playing: return
+
+        # The world is in world units, so the replay can be played in a window with the same aspect ratio
+        if (World.getSize(replay.width, replay.height), replay.tick_rate) != \
+                ((self.__world.width, self.__world.height), self.tick_rate):
+            raise ValueError("The replay was recorded with a window of {}x{} and {} ticks per second.".format(
+                replay.width, replay.height, replay.tick_rate))
+
+        self.__playback = replay
+        self.start()
+
+    def saveReplay(self):
+        """
+        Method to save the replay of the last game
+        """
+
+        try:
+            self.__replay.save(self.replay_fp)
+        except OSError:
+            return
+
+    def waitAssets(self):
+        """
+        Method that checks if the images have been loaded and then creates the game
+        """
+
+        # Checks again later while there are images being loaded
+        if not all(future.done() for future in self.__assets):
+            self.after(10, self.waitAssets)
+            return
+
+        # If an image could not be loaded, the window is closed and the error is raised again by "mainloop"
+        try:
+            for future in self.__assets:
+                future.result()
+
+            self.loadImages()
+
+        except Exception as error:
+            log.error("The images of the game could not be loaded: %s", error)
+            self.__error = error
+            self.destroy()
+            return
+
+        log.info("Images loaded in %.1f ms", (perf_counter() - self.__created) * 1000)
+
+        self.createGame()
+
+        # Removes the message and draws the first frame of the game
+        self.__splash.destroy()
+        self.update_idletasks()
+
+        log.info("First frame in %.1f ms", (perf_counter() - self.__created) * 1000)
+
+        if self.__callback:
+            self.__callback()
+
+    def render(self, alpha=1):
+        """
+        Method to draw the background, the bird and the tubes between the last two ticks received from the simulation
+        @param alpha: How far (0 to 1) the time is between the previous and the last tick
+        """
+
+        state = self.__snapshot
+
+        # Advances background animation if True
+        if self.background_animation:
+            distance = self.__world.toPixels(state.distanceAt(alpha))
+            self.__profiler.measure("background.run", self.__background.scrollTo, distance)
+
+        self.__profiler.measure("bird.run", self.__bird.run, alpha, state)
+        self.__profiler.measure("tubes.run", self.__tubes.run, alpha, state)
+
+        # Measures the latency of the key presses that are drawn for the first time in this frame
+        drawn = perf_counter()
+
+        for pressed, applied in self.__bird.getDrawnJumps(state.ticks):
+            self.__profiler.addLatency((applied - pressed) * 1000, (drawn - applied) * 1000)
+
+        # Ends the frame and shows its statistics
+        frame_time = self.__profiler.frame(self.__frame_ticks)
+        self.__frame_ticks = 0
+        self.__overlay.update()
+
+        # Changes the performance preset if the frames have been too slow or fast enough for a while
+        if self.__governor:
+            preset = self.__governor.update(frame_time)
+
+            if preset:
+                self.setPreset(preset)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+
     try:
         app = App()
         app.init()
@@ -0,0 +1,164 @@
+from math import ceil
+from time import perf_counter
+from tkinter import Tk
+
+from Simulation import Simulation
+
+
+class GameLoop(object):
+    """
+    Class to run the game on the thread of Tk with a single timer. The ticks are executed by a Simulation
+    on another thread, and at each frame the loop receives their snapshots and renders the last one.
+    The frame rate does not have to be the tick rate: with interpolation, the game can be drawn at the rate
+    of the display in positions between the last two ticks. Without interpolation, the frames are drawn half
+    a tick after the ticks are due, so each frame has one new tick to draw.
+    """
+
+    __afterID = None
+    __paused = False
+    __running = False
+    __simulation = None
+
+    def __init__(self, tk_instance, update_function, render_function, frame_rate=60, interpolate=True):
+        """
+        @param tk_instance: Instance of Tk used to schedule the loop
+        @param update_function: Callable that receives each snapshot published by the simulation.
+        If it returns False, the loop stops
+        @param render_function: Callable that receives how far (0 to 1) the time is between the last two ticks
+        @param frame_rate: Maximum number of frames per second
+        @param interpolate: If True, each frame is drawn between the last two ticks, otherwise in the last tick
+        """
+
+        # Checks past parameters and throws an error if something is incorrect
+        if not isinstance(tk_instance, Tk): raise TypeError("The tk_instance argument must be an instance of Tk.")
+        if not callable(update_function): raise TypeError("The update_function argument must be a callable object.")
+        if not callable(render_function): raise TypeError("The render_function argument must be a callable object.")
+        if frame_rate <= 0: raise ValueError("The frame_rate argument must be greater than zero.")
+
+        # Instance the parameters
+        self.__tk = tk_instance
+        self.__update = update_function
+        self.__render = render_function
+
+        # Duration of a frame in seconds
+        self.frame = 1 / frame_rate
+        self.interpolate = interpolate
+
+        # Time in which the next frame is due
+        self.__next_frame = 0
+
+        # Time in which the last received tick was due
+        self.__last_tick = 0
+
+    def isRunning(self):
+        """ Method to check if the loop is running """
+
+        return self.__running
+
+    def isPaused(self):
+        """ Method to check if the loop is paused """
+
+        return self.__paused
+
+    def pause(self):
+        """ Method to pause the loop and the simulation, cancelling the next execution """
+
+        if not self.__running or self.__paused: return
+
+        self.__paused = True
+
+        if self.__afterID is not None:
+            self.__tk.after_cancel(self.__afterID)
+            self.__afterID = None
+
+        self.__simulation.pause()
+
+    def nextFrame(self, time):
+        """ Method to return the time in which the first frame from a time is drawn. With interpolation, it is
+        the time itself. Otherwise it is the first time half a tick after a tick is due, since the timer of Tk
+        is not synchronized with the simulation and a frame at the time of a tick could draw it or not
+        @param time: Time returned by perf_counter from which the frame can be drawn """
+
+        if self.interpolate: return time
+
+        # The ticks are due at fixed intervals from the last one. A quarter of a tick is tolerated,
+        # so a frame that is scheduled exactly half a tick after a tick is not moved to the next one
+        tick = self.__simulation.tick
+        ticks = max(0, ceil((time - self.__last_tick) / tick - 0.75))
+
+        return self.__last_tick + (ticks + 0.5) * tick
+
+    def resume(self):
+        """ Method to resume the loop and the simulation """
+
+        if not self.__running or not self.__paused: return
+
+        # The simulation executes its next tick one tick after resuming
+        self.__paused = False
+        self.__last_tick = perf_counter()
+        self.__simulation.resume()
+        self.schedule(self.nextFrame(perf_counter() + self.frame))
+
+    def run(self):
+        """ Method that receives the snapshots of the ticks executed, renders and schedules itself again """
+
+        if not self.__running or self.__paused: return
+
+        # Passes the snapshots in the order in which the ticks were executed
+        snapshots = self.__simulation.poll()
+
+        for snapshot in snapshots:
+            self.__last_tick = snapshot.time
+
+            if self.__update(snapshot) is False:
+                self.stop()
+                return
+
+        # Renders the game between the last two ticks, based on the time since the last one was due.
+        # Without interpolation, the game is only rendered when there is a new tick to draw
+        if self.interpolate:
+            alpha = (perf_counter() - self.__last_tick) / self.__simulation.tick
+            self.__render(min(1, max(0, alpha)))
+        elif snapshots:
+            self.__render(1)
+
+        # Reruns the method when the next frame is due. The frames are counted from the first one, so the rounding
+        # of the delay to milliseconds does not change the frame rate. If the loop is late, it does not catch up
+        self.schedule(self.nextFrame(max(self.__next_frame + self.frame, perf_counter())))
+
+    def schedule(self, time):
+        """ Method to run the loop again at a time
+        @param time: Time returned by perf_counter in which the next frame is due """
+
+        self.__next_frame = time
+        delay = int(round((time - perf_counter()) * 1000))
+        self.__afterID = self.__tk.after(max(1, delay), self.run)
+
+    def start(self, simulation):
+        """ Method to start the loop and the simulation
+        @param simulation: Simulation that has not yet been started """
+
+        if not isinstance(simulation, Simulation): raise TypeError(
+            "The simulation argument must be an instance of Simulation.")
+
+        if self.__running: return
+
+        self.__running = True
+        self.__simulation = simulation
+        self.__last_tick = perf_counter()
+
+        simulation.start()
+        self.schedule(self.nextFrame(perf_counter() + self.frame))
+
+    def stop(self):
+        """ Method to stop the loop, cancelling the next execution, and the simulation """
+
+        self.__running = False
+        self.__paused = False
+
+        if self.__afterID is not None:
+            self.__tk.after_cancel(self.__afterID)
+            self.__afterID = None
+
+        if self.__simulation is not None:
+            self.__simulation.stop()
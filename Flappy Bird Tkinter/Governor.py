@@ -0,0 +1,57 @@
+from collections import deque
+
+from Profiler import Profiler
+
+
+class Governor(object):
+    """
+    Class to choose a performance level based on the time taken by the last frames. It moves down a level when
+    the frames stay over the budget of the current level and moves back up when they would fit well in the budget
+    of the level above.
+    """
+
+    def __init__(self, levels, level=0, window=120, percent=90, headroom=0.6):
+        """
+        @param levels: Sequence of (name, budget), from the best quality to the worst, where budget is the maximum
+        time in milliseconds that a frame can take at that level
+        @param level: Index of the initial level
+        @param window: Number of frames measured before changing the level
+        @param percent: Percentile of the frame times compared with the budgets
+        @param headroom: Fraction of the budget of the level above that the frames must fit in to move up
+        """
+
+        if not levels: raise ValueError("The levels argument must have at least one level.")
+
+        self.levels = list(levels)
+        self.level = max(0, min(len(self.levels) - 1, level))
+        self.percent = percent
+        self.headroom = headroom
+
+        self.__times = deque(maxlen=window)
+
+    def getName(self):
+        """ Method to return the name of the current level """
+
+        return self.levels[self.level][0]
+
+    def update(self, frame_time):
+        """ Method to add the time of a frame. Returns the name of the new level if it has changed, otherwise None
+        @param frame_time: Time in milliseconds taken by the frame """
+
+        self.__times.append(frame_time)
+
+        # The level only changes after a full window of frames, so a single slow frame does not change it
+        if len(self.__times) < self.__times.maxlen: return
+
+        time = Profiler.percentile(sorted(self.__times), self.percent)
+
+        if time > self.levels[self.level][1] and self.level < len(self.levels) - 1:
+            self.level += 1
+        elif self.level > 0 and time < self.levels[self.level - 1][1] * self.headroom:
+            self.level -= 1
+        else:
+            return
+
+        # The frames measured at the previous level are discarded
+        self.__times.clear()
+        return self.getName()
@@ -0,0 +1,70 @@
+from tkinter import Canvas
+
+
+class ItemPool(object):
+    """
+    Class to recycle image items of a canvas, hiding and repositioning them instead of deleting and creating them again
+    """
+
+    def __init__(self, canvas, tag="pooled"):
+
+        # Checks whether the parameter canvas is an instance of Canvas
+        if not isinstance(canvas, Canvas): raise TypeError("The canvas argument must be an instance of Canvas.")
+
+        self.__canvas = canvas
+        self.tag = tag
+
+        # Tag of the items that the new items are placed below, so the stacking order does not depend on
+        # when the items were created. If None, the new items are placed above all the others
+        self.below = None
+
+        # Items that are being used and items that are hidden waiting to be reused
+        self.__used = set()
+        self.__free = []
+
+    def __len__(self):
+        """ Returns the number of items created by the pool """
+
+        return len(self.__used) + len(self.__free)
+
+    def acquire(self, x, y, image, tags=()):
+        """ Method to return an image item at the position, reusing a hidden item whenever possible
+        @param x: Position X of the image
+        @param y: Position Y of the image
+        @param image: PhotoImage shown by the item
+        @param tags: Other tags of the item """
+
+        tags = (self.tag, ) + tuple(tags)
+
+        if self.__free:
+            item = self.__free.pop()
+            self.__canvas.coords(item, x, y)
+            self.__canvas.itemconfig(item, image=image, state="normal", tags=tags)
+        else:
+            item = self.__canvas.create_image(x, y, image=image, tags=tags)
+
+            if self.below is not None and self.__canvas.find_withtag(self.below):
+                self.__canvas.tag_lower(item, self.below)
+
+        self.__used.add(item)
+        return item
+
+    def release(self, item):
+        """ Method to hide an item so that it can be reused """
+
+        if item not in self.__used: return
+
+        self.__used.remove(item)
+        self.__free.append(item)
+
+        # The other tags are removed, so the hidden item is not affected by operations on them
+        self.__canvas.itemconfig(item, state="hidden", tags=(self.tag, ))
+
+    def releaseAll(self):
+        """ Method to hide all items of the pool """
+
+        if not self.__used: return
+
+        self.__free.extend(self.__used)
+        self.__used.clear()
+        self.__canvas.itemconfig(self.tag, state="hidden", tags=(self.tag, ))
@@ -0,0 +1,160 @@
+import logging
+import os
+import sqlite3
+from datetime import datetime
+from queue import Empty, Queue
+from threading import Thread
+from time import time
+
+log = logging.getLogger("Flappy Bird")
+
+
+class Leaderboard(object):
+    """
+    Class to keep the result of every game in a SQLite database. The games are written in batches
+    on a thread of their own, so saving a game never waits for the disk.
+    """
+
+    __schema = (
+        "CREATE TABLE IF NOT EXISTS games ("
+        "id INTEGER PRIMARY KEY, score INTEGER NOT NULL, duration REAL NOT NULL, seed INTEGER, "
+        "ticks INTEGER, timestamp REAL NOT NULL, day TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS games_score ON games (score DESC)",
+        "CREATE INDEX IF NOT EXISTS games_day ON games (day, score DESC)"
+    )
+
+    # Object put in the queue to end the thread
+    __close = object()
+
+    def __init__(self, fp="Data/scores.db", batch_size=32, flush_interval=1.0):
+        """
+        @param fp: Path of the database
+        @param batch_size: Maximum number of games written at once
+        @param flush_interval: Maximum time in seconds that a game waits to be written
+        """
+
+        self.fp = fp
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        # If the directory does not exist, it will be created
+        directory = os.path.split(fp)[0]
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # Creates the tables on the connection used to read, which belongs to the thread that created the leaderboard.
+        # With the WAL journal, reading does not wait for the thread that writes.
+        self.__connection = sqlite3.connect(fp)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+
+        for statement in self.__schema:
+            self.__connection.execute(statement)
+
+        self.__connection.commit()
+
+        # Games waiting to be written
+        self.__queue = Queue()
+
+        self.__writer = Thread(target=self.__write, daemon=True)
+        self.__writer.start()
+
+    def add(self, score, duration, seed=None, ticks=None, timestamp=None):
+        """ Method to save the result of a game. It returns at once and the game is written later.
+        @param score: Score of the game
+        @param duration: Time played in seconds
+        @param seed: Seed of the world of the game
+        @param ticks: Number of ticks of the game
+        @param timestamp: Time in which the game ended (seconds since the epoch). If None, the current time is used """
+
+        timestamp = time() if timestamp is None else timestamp
+        day = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+
+        self.__queue.put((score, duration, seed, ticks, timestamp, day))
+
+    def best(self):
+        """ Returns the best score saved, or 0 if there is none """
+
+        row = self.__connection.execute("SELECT MAX(score) FROM games").fetchone()
+        return row[0] or 0
+
+    def close(self):
+        """ Method to write the games that are waiting and to close the database """
+
+        if self.__writer.is_alive():
+            self.__queue.put(self.__close)
+            self.__writer.join()
+
+        self.__connection.close()
+
+    def count(self):
+        """ Returns the number of games saved """
+
+        return self.__connection.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def flush(self):
+        """ Method to wait until all the games added have been written """
+
+        self.__queue.join()
+
+    def top(self, limit=10, day=None):
+        """ Returns a list with the best games as dictionaries, from the best to the worst
+        @param limit: Maximum number of games
+        @param day: Day of the games ("YYYY-MM-DD" or datetime.date). If None, the games of all days are used """
+
+        query = "SELECT score, duration, seed, ticks, timestamp, day FROM games"
+        arguments = ()
+
+        if day is not None:
+            query += " WHERE day = ?"
+            arguments = (str(day), )
+
+        query += " ORDER BY score DESC, timestamp LIMIT ?"
+        cursor = self.__connection.execute(query, arguments + (limit, ))
+
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def __write(self):
+        """ Method executed by the thread that writes the games in batches """
+
+        connection = sqlite3.connect(self.fp)
+
+        try:
+            while True:
+                games = [self.__queue.get()]
+                closing = games[0] is self.__close
+
+                # Waits a little for other games, so they are written in the same transaction
+                while not closing and len(games) < self.batch_size:
+                    try:
+                        games.append(self.__queue.get(timeout=self.flush_interval))
+                    except Empty:
+                        break
+
+                    closing = games[-1] is self.__close
+
+                rows = [game for game in games if game is not self.__close]
+
+                # If the batch cannot be written, such as when another instance of the game has locked the
+                # database, its games are lost, but the thread keeps writing the next ones
+                try:
+                    if rows:
+                        with connection:
+                            connection.executemany(
+                                "INSERT INTO games (score, duration, seed, ticks, timestamp, day) "
+                                "VALUES (?, ?, ?, ?, ?, ?)",
+                                rows
+                            )
+
+                except sqlite3.Error as error:
+                    log.error("%d games could not be saved in the leaderboard: %s", len(rows), error)
+
+                finally:
+                    for game in games:
+                        self.__queue.task_done()
+
+                if closing: return
+
+        finally:
+            connection.close()
@@ -0,0 +1,32 @@
+def idle(world, rng):
+    """ Policy that never jumps """
+
+    return False
+
+
+def randomJumps(world, rng, chance=0.08):
+    """ Policy that jumps randomly """
+
+    return rng.random() < chance
+
+
+def followGap(world, rng):
+    """ Policy that jumps when the bird is falling below the middle of the space between the next tubes """
+
+    # Gets the first tube that the bird has not yet passed
+    target = world.height / 2
+
+    for tube in world.tubes:
+        if world.tubeX(tube) + world.tube_width / 2 > world.bird_x - world.bird_width / 2:
+            target = (tube.height + tube.bottom) / 2
+            break
+
+    return world.bird_y > target + world.bird_height / 4 and world.velocity >= 0
+
+
+# Policies by name. Each policy receives the World and a random.Random and returns True to jump
+policies = {
+    "idle": idle,
+    "random": randomJumps,
+    "gap": followGap
+}
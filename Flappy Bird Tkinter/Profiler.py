@@ -0,0 +1,311 @@
+import json
+import os
+from bisect import bisect_left
+from collections import deque
+from statistics import pstdev
+from time import perf_counter
+
+from Background import Background
+
+
+class Histogram(object):
+    """ Class to count values in buckets with fixed upper bounds, so any number of values uses the same memory """
+
+    # Upper bounds in milliseconds of the default buckets. The last bucket counts every greater value
+    bounds = (1, 2, 4, 8, 12, 16, 24, 33, 50, 67, 100, 150, 250, 500)
+
+    def __init__(self, bounds=None):
+        """
+        @param bounds: Sorted sequence with the upper bound of each bucket. If None, the default bounds are used
+        """
+
+        if bounds is not None:
+            self.bounds = tuple(bounds)
+
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+
+    def add(self, value):
+        """ Method to count a value in its bucket """
+
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+
+    def percentile(self, percent):
+        """ Returns the upper bound of the bucket that has the percentile, or None if there are no values or if it
+        is in the last bucket, which has no upper bound """
+
+        if not self.count: return
+
+        rank = max(1, int(round(percent / 100 * self.count)))
+        total = 0
+
+        for index, count in enumerate(self.counts):
+            total += count
+
+            if total >= rank:
+                return self.bounds[index] if index < len(self.bounds) else None
+
+    def rows(self):
+        """ Returns a list with the label and the count of each bucket """
+
+        labels = ["<= {}".format(bound) for bound in self.bounds] + ["> {}".format(self.bounds[-1])]
+        return list(zip(labels, self.counts))
+
+
+class Profiler(object):
+    """
+    Class to measure the time of each part of the game, frame by frame. The times of the last frames are kept
+    to calculate statistics and, if a file is given, every frame is written to it as a line of JSON.
+    """
+
+    def __init__(self, size=600, trace_fp=None, counter=None):
+        """
+        @param size: Number of frames used to calculate the statistics
+        @param trace_fp: Path of the JSONL file where the frames are written. If None, nothing is written
+        @param counter: Callable that returns the number of canvas items, or None
+        """
+
+        if counter is not None and not callable(counter): raise TypeError(
+            "The counter argument must be a callable object.")
+
+        self.size = size
+        self.trace_fp = trace_fp
+        self.__counter = counter
+        self.__trace = None
+
+        # Latencies of the key presses, from the press to the tick that applied it, from that tick to the frame
+        # that drew it and in total. They are kept for all the games, not only for the last frames
+        self.latencies = {name: Histogram() for name in ("queue", "display", "total")}
+
+        self.reset()
+
+    def add(self, name, duration):
+        """ Method to add a duration to a part of the current frame, such as a time measured on another thread
+        @param name: Name of the part of the game
+        @param duration: Time in milliseconds """
+
+        self.__current[name] = self.__current.get(name, 0) + duration
+
+    def addLatency(self, queued, displayed):
+        """ Method to add the latency of a key press
+        @param queued: Time in milliseconds from the press to the tick of the world that applied it
+        @param displayed: Time in milliseconds from that tick to the frame that drew it """
+
+        times = {"queue": queued, "display": displayed, "total": queued + displayed}
+
+        for name, value in times.items():
+            self.latencies[name].add(value)
+
+        if self.trace_fp:
+            self.writeTrace({
+                "time": round(perf_counter() - self.__start, 6),
+                "input_ms": {name: round(value, 4) for name, value in times.items()}
+            })
+
+    def close(self):
+        """ Method to close the trace file """
+
+        if self.__trace:
+            self.__trace.close()
+            self.__trace = None
+
+    def countItems(self):
+        """ Method to return the number of canvas items, or None if there is no counter """
+
+        return self.__counter() if self.__counter else None
+
+    def frame(self, ticks=0):
+        """ Method to end the current frame, saving the time since the previous frame and the time of each part.
+        Returns the total time in milliseconds of the parts of the frame.
+        @param ticks: Number of ticks of the world executed in the frame """
+
+        now = perf_counter()
+
+        # The first frame after a reset has no previous frame to be compared with
+        if self.__last_frame is not None:
+            self.frame_times.append((now - self.__last_frame) * 1000)
+
+        self.__last_frame = now
+
+        for name, duration in self.__current.items():
+            self.sections.setdefault(name, deque(maxlen=self.size)).append(duration)
+
+        # Writes the frame in the trace file
+        if self.trace_fp:
+            self.writeTrace({
+                "time": round(now - self.__start, 6),
+                "frame_ms": round(self.frame_times[-1], 4) if self.frame_times else None,
+                "ticks": ticks,
+                "sections": {name: round(duration, 4) for name, duration in self.__current.items()},
+                "items": self.countItems()
+            })
+
+        total = sum(self.__current.values())
+        self.__current = {}
+
+        return total
+
+    def measure(self, name, function, *args):
+        """ Method to call a function, adding its duration to the part of the current frame. Returns its result
+        @param name: Name of the part of the game
+        @param function: Callable that is measured """
+
+        start = perf_counter()
+        result = function(*args)
+        self.add(name, (perf_counter() - start) * 1000)
+
+        return result
+
+    def reset(self):
+        """ Method to discard all the measured frames, such as when a new game starts """
+
+        self.frame_times = deque(maxlen=self.size)
+        self.sections = {}
+
+        self.__current = {}
+        self.__last_frame = None
+        self.__start = perf_counter()
+
+    def skip(self):
+        """ Method to ignore the time until the next frame, such as the time that the game was paused """
+
+        self.__last_frame = None
+
+    def stats(self):
+        """ Method to return the statistics of the last frames: FPS, p50 and p99 of the frame time, jitter
+        (standard deviation of the frame time), number of canvas items, p50 of each part and p50 and p99 of the
+        total latency of the key presses (upper bounds of their buckets), all times in ms """
+
+        times = sorted(self.frame_times)
+        latency = self.latencies["total"]
+        latency = {"count": latency.count, "p50": latency.percentile(50), "p99": latency.percentile(99)}
+
+        if not times:
+            return {
+                "fps": 0, "p50": 0, "p99": 0, "jitter": 0, "items": self.countItems(), "sections": {}, "input": latency
+            }
+
+        return {
+            "fps": 1000 / (sum(times) / len(times)) if sum(times) else 0,
+            "p50": self.percentile(times, 50),
+            "p99": self.percentile(times, 99),
+            "jitter": pstdev(times),
+            "items": self.countItems(),
+            "sections": {name: self.percentile(sorted(values), 50) for name, values in self.sections.items()},
+            "input": latency
+        }
+
+    def wrap(self, name, function):
+        """ Method to return a function that measures the given function whenever it is called, like an event handler
+        @param name: Name of the part of the game
+        @param function: Callable that is measured """
+
+        def measured(*args):
+            return self.measure(name, function, *args)
+
+        return measured
+
+    def writeTrace(self, data):
+        """ Method to write a line of JSON in the trace file, opening it on the first call """
+
+        if not self.__trace:
+
+            # If the directory does not exist, it will be created
+            directory = os.path.split(self.trace_fp)[0]
+
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            self.__trace = open(self.trace_fp, "a")
+
+        self.__trace.write(json.dumps(data) + "\n")
+
+    @staticmethod
+    def percentile(values, percent):
+        """ Returns the percentile of a sorted list, using the nearest rank """
+
+        if not values: return 0
+
+        index = max(0, min(len(values) - 1, int(round(percent / 100 * len(values))) - 1))
+        return values[index]
+
+
+class Overlay(object):
+    """ Class to show the statistics of a Profiler on the top left corner of the background """
+
+    __tag = "overlay"
+
+    def __init__(self, background, profiler, interval=0.5, font=("Courier", 12), fill="yellow"):
+        """
+        @param background: Background where the statistics are shown
+        @param profiler: Profiler with the measured frames
+        @param interval: Minimum time in seconds between two updates of the text
+        """
+
+        # Checks past parameters and throws an error if something is incorrect
+        if not isinstance(background, Background): raise TypeError(
+            "The background argument must be an instance of Background.")
+        if not isinstance(profiler, Profiler): raise TypeError("The profiler argument must be an instance of Profiler.")
+
+        self.__background = background
+        self.__profiler = profiler
+        self.interval = interval
+        self.font = font
+        self.fill = fill
+
+        self.visible = False
+        self.__item = None
+        self.__last_update = 0
+
+    def hide(self):
+        """ Method to remove the text from the background """
+
+        self.visible = False
+
+        if self.__item is not None:
+            self.__background.delete(self.__item)
+            self.__item = None
+
+    def show(self):
+        """ Method to show the text on the background """
+
+        self.visible = True
+        self.update(force=True)
+
+    def toggle(self, event=None):
+        """ Method to show the text if it is hidden, or to hide it if it is shown """
+
+        self.hide() if self.visible else self.show()
+
+    def update(self, force=False):
+        """ Method to update the text with the statistics, at most once per interval
+        @param force: If True, the text is updated even if the interval has not passed """
+
+        if not self.visible: return
+
+        now = perf_counter()
+        if not force and now - self.__last_update < self.interval: return
+        self.__last_update = now
+
+        stats = self.__profiler.stats()
+
+        lines = [
+            "FPS {:6.1f}   items {}".format(stats["fps"], stats["items"]),
+            "frame p50 {:6.2f} ms   p99 {:6.2f} ms".format(stats["p50"], stats["p99"]),
+            "jitter {:6.2f} ms".format(stats["jitter"]),
+            "input p50 <= {} ms   p99 <= {} ms   ({} presses)".format(
+                stats["input"]["p50"] or "-", stats["input"]["p99"] or "-", stats["input"]["count"])
+        ]
+        lines.extend("{:<16} {:7.3f} ms".format(name, value) for name, value in sorted(stats["sections"].items()))
+
+        # The background deletes its items when a game starts, so the text is created again if needed
+        if self.__item is None or not self.__background.type(self.__item):
+            self.__item = self.__background.create_text(
+                10, 10, anchor="nw", text="\n".join(lines), fill=self.fill, font=self.font, tag=self.__tag
+            )
+        else:
+            self.__background.itemconfig(self.__item, text="\n".join(lines))
+
+        # Keeps the text in front of the tubes and the bird
+        self.__background.tag_raise(self.__item)
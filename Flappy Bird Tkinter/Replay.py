@@ -0,0 +1,167 @@
+import os
+import struct
+import sys
+from argparse import ArgumentParser
+
+from World import World
+
+
+class Replay(object):
+    """
+    Class with the record of a game: the seed of the world and the ticks in which the bird jumped.
+    The world is deterministic, so this is enough to play the same game again.
+
+    The file has a header (magic, version, width, height, tick rate, seed, score, ticks, number of jumps)
+    followed by the differences between the ticks of consecutive jumps, each one encoded as a varint.
+    """
+
+    magic = b"FBRP"
+    # Version 2 replays are played in world units, so they can be played in any window with the same aspect ratio
+    version = 2
+    __header = struct.Struct("<4sBHHHIIII")
+
+    def __init__(self, seed, width, height, tick_rate, jumps=(), score=0, ticks=0):
+
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.tick_rate = tick_rate
+
+        # Ticks, in increasing order, in which the bird jumped
+        self.jumps = list(jumps)
+        self.__jumps = None
+
+        # Result of the game
+        self.score = score
+        self.ticks = ticks
+
+    def createWorld(self):
+        """ Method to return a world in the initial state of the recorded game """
+
+        return World(self.width, self.height, tick=1000 / self.tick_rate, seed=self.seed)
+
+    def finish(self, world):
+        """ Method to save the result of the game of the world """
+
+        self.score = world.score
+        self.ticks = world.ticks
+
+    def jumpAt(self, tick):
+        """ Method to check if the bird jumped in the tick, counting from 0 """
+
+        if self.__jumps is None:
+            self.__jumps = frozenset(self.jumps)
+
+        return tick in self.__jumps
+
+    def record(self, tick):
+        """ Method to record a jump in the tick, counting from 0 """
+
+        self.jumps.append(tick)
+        self.__jumps = None
+
+    def simulate(self, world=None):
+        """ Method to play the recorded game again as fast as possible, without display. Returns the world at the end.
+        @param world: World that will be used. If None, a new one will be created """
+
+        if world is None:
+            world = self.createWorld()
+
+        world.reset(self.seed)
+        jumps = iter(self.jumps)
+        jump = next(jumps, None)
+
+        while world.alive and world.ticks < self.ticks:
+
+            # Checks if the bird jumps in this tick
+            if jump == world.ticks:
+                world.step(True)
+                jump = next(jumps, None)
+            else:
+                world.step(False)
+
+        return world
+
+    def save(self, fp):
+        """ Method to save the replay in a binary file """
+
+        data = bytearray(self.__header.pack(
+            self.magic, self.version, self.width, self.height, self.tick_rate,
+            self.seed, self.score, self.ticks, len(self.jumps)
+        ))
+
+        # Saves the differences between the ticks, which are small numbers, using 7 bits per byte
+        last = 0
+
+        for tick in self.jumps:
+            value, last = tick - last, tick
+
+            while value >= 0x80:
+                data.append((value & 0x7F) | 0x80)
+                value >>= 7
+
+            data.append(value)
+
+        # If the directory does not exist, it will be created
+        directory = os.path.split(fp)[0]
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(fp, "wb") as file:
+            file.write(data)
+
+    @classmethod
+    def load(cls, fp):
+        """ Method to load a replay from a binary file """
+
+        with open(fp, "rb") as file:
+            data = file.read()
+
+        magic, version, width, height, tick_rate, seed, score, ticks, count = cls.__header.unpack_from(data)
+
+        if magic != cls.magic or version != cls.version:
+            raise ValueError("The file {} is not a replay of this version of the game.".format(fp))
+
+        # Reads the differences between the ticks of the jumps
+        jumps = []
+        position = cls.__header.size
+        last = 0
+
+        for i in range(count):
+            value = shift = 0
+
+            while True:
+                byte = data[position]
+                position += 1
+                value |= (byte & 0x7F) << shift
+                shift += 7
+
+                if byte < 0x80: break
+
+            last += value
+            jumps.append(last)
+
+        return cls(seed, width, height, tick_rate, jumps, score, ticks)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Checks or plays a replay of a game.")
+    parser.add_argument("mode", choices=("verify", "play"), help="verify: simulates without display, play: shows it")
+    parser.add_argument("file")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.file)
+
+    if args.mode == "verify":
+        world = replay.simulate()
+        print("Recorded score: {}, simulated score: {}, ticks: {}".format(replay.score, world.score, world.ticks))
+        sys.exit(0 if world.score == replay.score else 1)
+
+    # The game module has a space in its name, so it is loaded by its path
+    from runpy import run_path
+    App = run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Flappy Bird.py"))["App"]
+
+    app = App()
+    app.init(lambda: app.playReplay(replay))
+    app.mainloop()
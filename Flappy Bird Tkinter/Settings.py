@@ -42,6 +42,8 @@ class Settings(object):
     window_fullscreen_event = "<F11>"
     window_start_event = "<Return>"
     window_exit_event = "<Escape>"
+    overlay_event = "<F3>"
+    pause_event = "<p>"
 
     # File paths
     background_fp = "Images/background.png"
@@ -51,21 +53,87 @@ class Settings(object):
     tube_fp = ["Images/tube.png", "Images/tube_mouth.png"]
     title_fp = "Images/title.png"
     scoreboard_fp = "Images/scoreboard.png"
+    atlas_fp = "Data/atlas.png"
+    atlas_index_fp = "Data/atlas.json"
     score_fp = "Data/scr.txt"
+    leaderboard_fp = "Data/scores.db"
     settings_fp = "Data/settings.json"
+    replay_fp = "Data/last_game.replay"
+    trace_fp = None
 
     # Animation settings
     background_animation = True
 
+    # Game loop settings
+    tick_rate = 60
+    max_step = 0.25
+
+    # Speed of the game compared with the real time, used to play automated games faster
+    simulation_speed = 1
+
+    # Render settings. By default the game is drawn once per tick, half a tick after it is due, in the positions of
+    # the last tick. In the high refresh rate mode it is drawn up to frame_cap times per second, in positions between
+    # the last two ticks, so frame_cap should not be higher than the refresh rate of the display.
+    high_refresh_rate = False
+    frame_cap = 144
+
+    # Performance settings. The trace is only written if a file path is given
+    performance_overlay = False
+    tube_cache_size = 32
+
+    # Takes the images from the atlas built by Atlas.py. It is disabled by default, since decoding the whole
+    # atlas takes longer than decoding the images from their own files in parallel
+    use_atlas = False
+
+    # Performance presets. If a preset is chosen, its values replace the settings above. The governor, if enabled,
+    # moves to the next preset when the frames take too long and back when they are fast again.
+    # Slower presets keep more tube images in the cache, trading memory for the time of resizing them.
+    # The overlay is not part of the presets, so the governor never hides it while the game is slow.
+    performance_preset = None
+    performance_governor = False
+    performance_presets = {
+        "high": {"tick_rate": 60, "frame_cap": 144, "background_animation": True, "tube_cache_size": 32},
+        "medium": {"tick_rate": 45, "frame_cap": 90, "background_animation": True, "tube_cache_size": 64},
+        "low": {"tick_rate": 30, "frame_cap": 45, "background_animation": False, "tube_cache_size": 128}
+    }
+
     # Joins all directories into one list
-    images_fp = [background_fp, bird_fp, startButton_fp, exitButton_fp, tube_fp[0], tube_fp[1], title_fp]
+    images_fp = [
+        background_fp, bird_fp, startButton_fp, exitButton_fp, tube_fp[0], tube_fp[1], title_fp, scoreboard_fp
+    ]
+
+    def getFrameRate(self, preset=None):
+        """ Method to return the number of frames drawn per second in the render mode of the settings
+        @param preset: Name of a performance preset whose values are used instead of the current settings """
+
+        values = self.performance_presets[preset] if preset else {}
+
+        if self.high_refresh_rate:
+            return values.get("frame_cap", self.frame_cap)
+
+        return values.get("tick_rate", self.tick_rate)
+
+    def applyPreset(self, name):
+        """ Method to replace the settings with the values of a performance preset
+        @param name: Name of the preset in performance_presets """
+
+        if name not in self.performance_presets: raise ValueError("Unknown performance preset: {}".format(name))
+
+        for attr, value in self.performance_presets[name].items():
+            setattr(Settings, attr, value)
+
+        Settings.performance_preset = name
 
     def setOptions(self):
         """ Method to receive some game settings from a.json file. 
         If the file does not exist, one with the default settings will be created. """
 
         # Some attributes that can be changed
-        attributes = "window_fullscreen,window_width,window_height".split(',')
+        attributes = (
+            "window_fullscreen,window_width,window_height,tick_rate,max_step,high_refresh_rate,frame_cap,"
+            "background_animation,"
+            "performance_overlay,trace_fp,tube_cache_size,use_atlas,performance_preset,performance_governor,performance_presets"
+        ).split(',')
 
         # Tries to open the file stop reading
         try:
@@ -100,3 +168,7 @@ class Settings(object):
             # Put the information in the file and close it
             file.write(dumps(data, indent=2))
             file.close()
+
+        # The values of the chosen preset replace the other settings
+        if self.performance_preset:
+            self.applyPreset(self.performance_preset)
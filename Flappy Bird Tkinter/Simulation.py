@@ -0,0 +1,116 @@
+from queue import Empty, Queue
+from threading import Event, Thread, current_thread
+from time import perf_counter
+
+from World import World
+
+
+class Simulation(Thread):
+    """
+    Class to advance a World in ticks of fixed duration on its own thread. After each tick, an immutable
+    snapshot of the world is published in a queue, so the thread of Tk can draw it without touching the world.
+    The thread ends when the bird dies or when the "stop" method is called, and it sleeps while paused.
+    """
+
+    def __init__(self, world, control_function, tick_rate=60, max_step=0.25):
+        """
+        @param world: World that is advanced. It must not be changed by other threads while the simulation runs
+        @param control_function: Callable that receives the world before each tick and returns True to jump.
+        It is called on the thread of the simulation
+        @param tick_rate: Number of ticks per second
+        @param max_step: Maximum time in seconds that the simulation advances at once when it is late. The time
+        elapsed is caught up with ticks up to this limit, so the game only slows down in longer pauses
+        """
+
+        # Checks past parameters and throws an error if something is incorrect
+        if not isinstance(world, World): raise TypeError("The world argument must be an instance of World.")
+        if not callable(control_function): raise TypeError("The control_function argument must be a callable object.")
+        if tick_rate <= 0: raise ValueError("The tick_rate argument must be greater than zero.")
+
+        # The thread does not keep the program open if the window is closed
+        Thread.__init__(self, daemon=True)
+
+        # Instance the parameters
+        self.__world = world
+        self.__control = control_function
+        # Duration of a tick in seconds
+        self.tick = 1 / tick_rate
+
+        # Maximum number of ticks executed at once
+        self.max_catch_up = max(1, int(max_step / self.tick))
+
+        self.__snapshots = Queue()
+        self.__stop = Event()
+
+        # Set while the simulation is not paused
+        self.__unpaused = Event()
+        self.__unpaused.set()
+
+    def isPaused(self):
+        """ Method to check if the simulation is paused """
+
+        return not self.__unpaused.is_set()
+
+    def pause(self):
+        """ Method to pause the simulation. The thread sleeps until the simulation is resumed or stopped """
+
+        self.__unpaused.clear()
+
+    def resume(self):
+        """ Method to resume the simulation. The time that it was paused is not caught up """
+
+        self.__unpaused.set()
+
+    def poll(self):
+        """ Method to return the list of snapshots published since the last call, in order """
+
+        snapshots = []
+
+        while True:
+            try:
+                snapshots.append(self.__snapshots.get_nowait())
+            except Empty:
+                return snapshots
+
+    def run(self):
+        """ Method that executes the ticks when they are due, until the bird dies or the simulation is stopped """
+
+        world = self.__world
+        next_tick = perf_counter() + self.tick
+
+        while not self.__stop.is_set():
+
+            # Executes the late ticks, but no more than the limit, so the game does not freeze trying to catch up
+            ticks = 0
+
+            while next_tick <= perf_counter() and ticks < self.max_catch_up:
+                start = perf_counter()
+                world.step(self.__control(world))
+
+                self.__snapshots.put(world.snapshot(next_tick, (perf_counter() - start) * 1000))
+                next_tick += self.tick
+                ticks += 1
+
+                if not world.alive: return
+
+            # If the limit has been reached, the remaining late time is discarded
+            if next_tick <= perf_counter():
+                next_tick = perf_counter() + self.tick
+
+            # Waits until the next tick is due, or until the simulation is stopped
+            self.__stop.wait(max(0, next_tick - perf_counter()))
+
+            # While paused, the thread waits without using the processor and the next tick is due after resuming
+            if not self.__unpaused.is_set():
+                self.__unpaused.wait()
+                next_tick = perf_counter() + self.tick
+
+    def stop(self, timeout=1):
+        """ Method to stop the simulation and wait for its thread to end
+        @param timeout: Maximum time in seconds to wait """
+
+        self.__stop.set()
+        self.__unpaused.set()
+
+        if self.is_alive() and self is not current_thread():
+            self.join(timeout)
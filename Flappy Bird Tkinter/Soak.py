@@ -0,0 +1,275 @@
+import gc
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from argparse import ArgumentParser
+from random import Random
+from tempfile import mkdtemp
+
+from Policies import policies
+from Settings import Settings
+
+
+def getRSS():
+    """ Returns the memory (resident set size) used by the process in bytes, or None if it is not available """
+
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        from resource import RUSAGE_SELF, getrusage
+    except ImportError:
+        return
+
+    # Without /proc only the peak is known, which is in kilobytes on Linux and in bytes on macOS
+    peak = getrusage(RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def getTracedMemory():
+    """ Returns the memory in bytes allocated by Python and still in use, except for the measures of the soak itself,
+    or None if tracemalloc is not tracing """
+
+    if not tracemalloc.is_tracing(): return
+
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__)
+    ))
+
+    return sum(statistic.size for statistic in snapshot.statistics("filename"))
+
+
+class Soak(object):
+    """
+    Class to play many automated games back to back in the game window, measuring after each game the memory of
+    the process, the memory allocated by Python, the PhotoImages of Tk, the canvas items, the widgets and the threads.
+    The soak fails if any of them keeps growing after the first games. The images of the tube cache and the items of
+    the pool are counted apart, since they grow for a while, and the soak fails if they go over their limits.
+    """
+
+    # Growth tolerated in each measure from the end of the warm-up to the last game
+    tolerances = {
+        "rss": 8 * 1024 * 1024,
+        "traced": 1024 * 1024,
+        "photo_images": 0,
+        "canvas_items": 0,
+        "widgets": 0,
+        "threads": 0
+    }
+
+    def __init__(self, app, games=1000, policy="random", warmup=20, seed=0, output=None, top=10, max_ticks=36000):
+        """
+        @param app: Instance of the App, created but not initialized
+        @param games: Number of games played
+        @param policy: Name of the policy of Policies that plays the games
+        @param warmup: Number of first games that are not used to check the growth, while the caches are filled
+        @param seed: Seed of the random generator of the policy
+        @param output: Path of a JSONL file where the measures of each game are written, or None
+        @param top: Number of places of the code shown in the report of the allocations that have grown
+        @param max_ticks: Maximum number of ticks of a game, so policies that do not lose still end their games
+        """
+
+        if policy not in policies: raise ValueError("Unknown policy: {}".format(policy))
+
+        self.app = app
+        self.games = games
+        self.warmup = min(warmup, max(0, games - 2))
+        self.output = output
+        self.top = top
+        self.max_ticks = max_ticks
+
+        self.results = []
+        self.failures = []
+        self.allocations = []
+
+        self.__policy = policies[policy]
+        self.__rng = Random(seed)
+        self.__snapshot = None
+        self.__file = None
+
+    def bounds(self):
+        """ Method to return the maximum number of images of the tube cache and of items of the pool """
+
+        background = self.app.getBackground()
+        cache = getattr(background, "tubeCache", None)
+
+        # Each tube has four items: the mouth and the body of the top tube and of the bottom tube
+        return {
+            "tube_images": max(cache.size if cache else 0, self.app.tube_cache_size),
+            "pool_items": 4 * self.app.getWorld().getMaxTubes()
+        }
+
+    def check(self):
+        """ Method to check the growth of each measure after the warm-up and the measures that have limits.
+        Returns a list with the failures """
+
+        results = self.results[self.warmup:]
+        self.failures = []
+
+        for name, bound in self.bounds().items():
+            values = [result[name] for result in self.results]
+
+            if values and max(values) > bound:
+                self.failures.append("{} reached {} (limit {})".format(name, max(values), bound))
+
+        for name, tolerance in self.tolerances.items():
+            values = [result[name] for result in results if result[name] is not None]
+            if len(values) < 2: continue
+
+            growth = self.trend(values) * (len(values) - 1)
+
+            if growth > tolerance:
+                self.failures.append("{} grew by {:.1f} over {} games (tolerance {})".format(
+                    name, growth, len(values), tolerance))
+
+        return self.failures
+
+    def control(self, world):
+        """ Method that returns if the bird jumps, according to the policy. It runs on the thread of the simulation """
+
+        # Ends the game when it reaches the limit of ticks, as if the bird had died
+        if world.ticks >= self.max_ticks:
+            world.alive = False
+            world.cause = "timeout"
+            return False
+
+        return self.__policy(world, self.__rng)
+
+    def finish(self):
+        """ Method to compare the allocations with the ones at the end of the warm-up and to stop the game """
+
+        if self.__snapshot:
+            statistics = tracemalloc.take_snapshot().compare_to(self.__snapshot, "lineno")
+            self.allocations = [str(statistic) for statistic in statistics[:self.top]]
+
+        if self.__file:
+            self.__file.close()
+
+        self.check()
+        self.app.quit()
+
+    def measure(self):
+        """ Method to return the measures of the game that has just ended """
+
+        # Frees the objects in reference cycles, so only the memory that is really kept is measured
+        gc.collect()
+
+        background = self.app.getBackground()
+        cache = getattr(background, "tubeCache", None)
+
+        tube_images = len(cache) if cache else 0
+        pool_items = len(background.pool)
+
+        return {
+            "game": len(self.results) + 1,
+            "score": self.app.getWorld().score,
+            "ticks": self.app.getWorld().ticks,
+            "rss": getRSS(),
+            "traced": getTracedMemory(),
+            "photo_images": len(self.app.tk.splitlist(self.app.tk.call("image", "names"))) - tube_images,
+            "canvas_items": len(background.find_all()) - pool_items,
+            "tube_images": tube_images,
+            "pool_items": pool_items,
+            "widgets": len(self.app.winfo_children()) + len(background.winfo_children()),
+            "threads": threading.active_count()
+        }
+
+    def next(self):
+        """ Method that waits for the current game to end, measures it and starts the next one """
+
+        if self.app.isPlaying():
+            self.app.after(50, self.next)
+            return
+
+        # Measures the game that has just ended, if there is one
+        if self.app.getWorld().ticks:
+            result = self.measure()
+            self.results.append(result)
+
+            if self.__file:
+                self.__file.write(json.dumps(result) + "\n")
+
+            # After the warm-up, the allocations are saved to be compared at the end
+            if len(self.results) == self.warmup and tracemalloc.is_tracing():
+                self.__snapshot = tracemalloc.take_snapshot()
+
+        if len(self.results) >= self.games:
+            self.finish()
+            return
+
+        self.app.start()
+        self.app.after(50, self.next)
+
+    def run(self):
+        """ Method to play all the games. Returns True if no measure has grown """
+
+        if self.output:
+            self.__file = open(self.output, "w")
+
+        self.app.setController(self.control)
+        self.app.init(self.next)
+        self.app.mainloop()
+
+        return not self.failures
+
+    @staticmethod
+    def trend(values):
+        """ Returns the slope of the line that best fits the values (least squares), that is, the growth per game """
+
+        count = len(values)
+        mean_x = (count - 1) / 2
+        mean_y = sum(values) / count
+
+        numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+        denominator = sum((x - mean_x) ** 2 for x in range(count))
+
+        return numerator / denominator if denominator else 0
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Plays many automated games in a row and checks that nothing keeps growing.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--policy", default="random", choices=sorted(policies))
+    parser.add_argument("--warmup", type=int, default=20, help="Number of first games not used to check the growth")
+    parser.add_argument("--speed", type=float, default=10, help="Speed of the games compared with the real time")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=36000, help="Maximum number of ticks of a game")
+    parser.add_argument("--output", default=None, help="JSONL file for the measures of each game")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="Does not trace the allocations of Python")
+    args = parser.parse_args()
+
+    if not args.no_tracemalloc:
+        tracemalloc.start()
+
+    # The games are not saved with the ones of the player
+    directory = mkdtemp(prefix="flappy-soak-")
+    Settings.leaderboard_fp = os.path.join(directory, "scores.db")
+    Settings.replay_fp = os.path.join(directory, "last_game.replay")
+    Settings.simulation_speed = args.speed
+
+    # The game module has a space in its name, so it is loaded by its path
+    from runpy import run_path
+    App = run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Flappy Bird.py"))["App"]
+
+    soak = Soak(App(), args.games, args.policy, args.warmup, args.seed, args.output, max_ticks=args.max_ticks)
+    passed = soak.run()
+
+    for name in ("rss", "traced", "photo_images", "canvas_items", "tube_images", "pool_items", "widgets", "threads"):
+        values = [result[name] for result in soak.results]
+        print("{:<14} first {}  last {}".format(name, values[0] if values else None, values[-1] if values else None))
+
+    if soak.allocations:
+        print("Allocations that grew the most since the warm-up:")
+
+        for line in soak.allocations:
+            print("  " + line)
+
+    for failure in soak.failures:
+        print("FAIL: " + failure)
+
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,138 @@
+import json
+import sys
+from argparse import ArgumentParser
+from collections import Counter
+from multiprocessing import Pool
+from random import Random
+from statistics import mean, median
+
+from Policies import policies
+from World import World
+
+# Courses and settings of the games, shared by all the games of a worker process
+_courses = {}
+_settings = {}
+
+
+def _initWorker(courses, settings):
+    """ Receives, once per worker process, the courses and the settings of the games """
+
+    _courses.update(courses)
+    _settings.update(settings)
+
+
+def playGame(task):
+    """ Plays a game without display and returns its result
+    @param task: Tuple (seed, policy name) """
+
+    seed, policy_name = task
+    settings = _settings
+    policy = policies[policy_name]
+
+    world = World(settings["width"], settings["height"], tick=settings["tick"], course=_courses[seed])
+
+    # Each policy has its own random generator, so the results do not depend on the order of the games
+    rng = Random("{}-{}".format(seed, policy_name))
+    jumps = 0
+
+    while world.alive and world.ticks < settings["max_ticks"]:
+        jump = policy(world, rng)
+        jumps += jump
+        world.step(jump)
+
+    return {
+        "seed": seed, "policy": policy_name, "score": world.score, "ticks": world.ticks,
+        "jumps": jumps, "cause": world.cause or "timeout"
+    }
+
+
+class Tournament(object):
+    """
+    Class to play many games without display in a pool of processes, for all combinations of seeds and policies
+    """
+
+    def __init__(self, seeds, policy_names, width=1920, height=1080, tick_rate=60, max_ticks=36000, processes=None):
+
+        # Checks if all policies exist
+        for name in policy_names:
+            if name not in policies: raise ValueError("Unknown policy: {}".format(name))
+
+        self.seeds = list(seeds)
+        self.policy_names = list(policy_names)
+        self.processes = processes
+
+        self.settings = {"width": width, "height": height, "tick": 1000 / tick_rate, "max_ticks": max_ticks}
+
+        # Creates the courses only once. A course has enough tubes for the longest game
+        world = World(width, height, tick=1000 / tick_rate)
+        length = int(max_ticks * world.tube_speed / world.min_distance) + 2
+
+        self.courses = {seed: world.createCourse(length, Random(seed)) for seed in self.seeds}
+
+    def run(self, chunksize=16):
+        """ Generator that plays all games and returns their results as they finish """
+
+        tasks = [(seed, name) for seed in self.seeds for name in self.policy_names]
+
+        with Pool(self.processes, initializer=_initWorker, initargs=(self.courses, self.settings)) as pool:
+            for result in pool.imap_unordered(playGame, tasks, chunksize):
+                yield result
+
+    @staticmethod
+    def summarize(results):
+        """ Returns a summary of the results, by policy """
+
+        games = {}
+
+        for result in results:
+            games.setdefault(result["policy"], []).append(result)
+
+        summary = {}
+
+        for name, results in games.items():
+            scores = [result["score"] for result in results]
+
+            summary[name] = {
+                "games": len(results),
+                "score_mean": mean(scores),
+                "score_median": median(scores),
+                "score_max": max(scores),
+                "score_min": min(scores),
+                "ticks_mean": mean(result["ticks"] for result in results),
+                "jumps_mean": mean(result["jumps"] for result in results),
+                "causes": dict(Counter(result["cause"] for result in results))
+            }
+
+        return summary
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Plays games without display for many seeds and policies in parallel.")
+    parser.add_argument("--seeds", type=int, default=100, help="Number of seeds, starting from --first-seed")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--policies", default=",".join(policies), help="Policies separated by commas")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--max-ticks", type=int, default=36000)
+    parser.add_argument("--tick-rate", type=int, default=60)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--output", default=None, help="JSONL file for the results of each game (default: stdout)")
+    args = parser.parse_args()
+
+    tournament = Tournament(
+        range(args.first_seed, args.first_seed + args.seeds), args.policies.split(","), args.width, args.height,
+        args.tick_rate, args.max_ticks, args.processes
+    )
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    results = []
+
+    # Writes the results as the games finish
+    for result in tournament.run():
+        results.append(result)
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
+    if args.output: output.close()
+
+    print(json.dumps(Tournament.summarize(results), indent=2))
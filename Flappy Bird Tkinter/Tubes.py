@@ -1,268 +1,204 @@
-from random import randint
-from threading import Thread
+from collections import OrderedDict, deque, namedtuple
 
+from Assets import Assets
 from Background import Background
-from Bird import Bird
-from PIL.Image import open as openImage
-from PIL.ImageTk import PhotoImage
+from World import World
 
 
-class Tubes(Thread):
-    """ Class for creating pipes """
+class TubeImageCache(object):
+    """ Class to keep the images of the tube bodies, with their heights rounded up to a few sizes """
 
-    __distance = 0
-    __move = 10
-    __pastTubes = []
-
-    def __init__(self, background, bird, score_function=None, *screen_geometry, fp=("tube.png", "tube_mourth"),
-                 animation_speed=50):
-
-        # Checks past parameters and throws an error if something is incorrect
-        if not isinstance(background, Background): raise TypeError(
-            "The background argument must be an instance of Background.")
-        if not len(fp) == 2: raise TypeError(
-            "The parameter fp should be a sequence containing the path of the images of the tube body and the tube mouth.")
-        if not isinstance(bird, Bird): raise TypeError("The birdargument must be an instance of Bird.")
-        if not callable(score_function): raise TypeError("The score_function argument must be a callable object.")
-
-        Thread.__init__(self)
-
-        # Instance the parameters
-        self.__background = background
-        self.image_path = fp
-        self.__animation_speed = animation_speed
-        self.__score_method = score_function
+    def __init__(self, image, step, size=32):
+        """
+        @param image: PIL.Image of the tube body that will be resized
+        @param step: Difference in pixels between two consecutive heights of the images
+        @param size: Maximum number of images kept, the least recently used ones are discarded first
+        """
 
-        # Receives the width and height of the background
-        self.__width = screen_geometry[0]
-        self.__height = screen_geometry[1]
+        self.__image = image
+        self.__images = OrderedDict()
+        self.step = max(1, step)
+        self.size = size
 
-        # Gets bird size
-        self.__bird_w = bird.width
-        self.__bird_h = bird.height
+    def __len__(self):
+        """ Returns the number of images kept """
 
-        # Calculates the width and height of the image
-        self.__imageWidth = (self.__width // 100) * 10
-        self.__imageHeight = (self.__height // 100) * 5
+        return len(self.__images)
 
-        # Creates a list to save images of the tubes
-        try:
-            self.deleteAll()
-        except:
-            self.__background.tubeImages = []
+    def get(self, height):
+        """ Method to return a PhotoImage of the tube body with at least the given height
+        @param height: Minimum height of the image """
 
-        # Creates a list only to save future images of the bodies of the generated tubes
-        self.__background.tubeImages.append([])
+        # Rounds the height up to the next multiple of the step
+        height = int(-(-max(1, height) // self.step) * self.step)
+        key = (self.__image.width, height)
 
-        # Loads the image of the tube mouth
-        self.__background.tubeImages.append(
-            self.getPhotoImage(
-                image_path=self.image_path[1],
-                width=self.__imageWidth,
-                height=self.__imageHeight,
-                closeAfter=True)[0]
-        )
+        # If the image is in the cache, it is marked as the most recently used
+        if key in self.__images:
+            self.__images.move_to_end(key)
+            return self.__images[key]
 
-        # Carries tube body image
-        self.__background.tubeImages.append(
-            self.getPhotoImage(
-                image_path=self.image_path[0],
-                width=self.__imageWidth,
-                height=self.__imageHeight)[1]
-        )
+        # Creates the image and discards the least recently used one if the cache is full
+        self.__images[key] = Assets.getPhotoImage(image=self.__image, width=key[0], height=key[1])
 
-        # Calculates the initial minimum distance between the tubes
-        self.__minDistance = int(self.__imageWidth * 4.5)
+        while len(self.__images) > max(1, self.size):
+            self.__images.popitem(last=False)
 
-        self.__stop = False
-        self.__tubes = []
-
-    def createNewTubes(self):
-        """ Method to create 2 new tubes (bottom and top) in the same Position X """
-
-        # Creates a list to store the body parts of the top tube
-        tube1 = []
+        return self.__images[key]
 
-        #Sets the X position that the top tube will initially appear in the background
-        width = self.__width + (self.__imageWidth)
 
-        # Sets a Y position for the tube randomly respecting some rules that are: 
-        # Space for the bird to pass and space to add the bottom tube.
+# Tube drawn in the background: position X of the tube in the world, canvas items and images of the bodies
+DrawnTube = namedtuple("DrawnTube", "offset items images")
 
-        height = randint(self.__imageHeight // 2, self.__height - (self.__bird_h * 2) - self.__imageHeight)
 
-        # Creates and adds to the top tube body list, the tube mouth
-        tube1.append(self.__background.create_image(width, height, image=self.__background.tubeImages[1]))
-
-        # Creates a new image in the image list with the height being equal to the Y position of the top tube
-        self.__background.tubeImages[0].append(
-            [self.getPhotoImage(image=self.__background.tubeImages[2], width=self.__imageWidth, height=height)[0], ]
-        )
+class Tubes(object):
+    """ Class for drawing the pipes of a World, or of its snapshots """
 
-        # Sets the Y position of the top tube body
-        y = (height // 2) + 1 - (self.__imageHeight // 2)
+    # Maximum number of images of tube bodies kept in the cache
+    cache_size = 32
 
-        # Creates and adds to the top tube body list, the tube body
-        tube1.append(self.__background.create_image(width, y, image=self.__background.tubeImages[0][-1][0]))
+    # Tag shared by all the images of the tubes, so that they are moved at once
+    __tag = "tube"
 
-        ###############################################################################################################
-        ###############################################################################################################
+    def __init__(self, background, world, fp=("tube.png", "tube_mourth"), cache_size=None):
 
-        # Creates a list to store the body parts of the bottom tube
-        tube2 = []
+        # Checks past parameters and throws an error if something is incorrect
+        if not isinstance(background, Background): raise TypeError(
+            "The background argument must be an instance of Background.")
+        if not len(fp) == 2: raise TypeError(
+            "The parameter fp should be a sequence containing the path of the images of the tube body and the tube mouth.")
+        if not isinstance(world, World): raise TypeError("The world argument must be an instance of World.")
 
-        #The Y position of the bottom tube is calculated based on the position of the top tube, plus the size of the bird
-        height = height + (self.__bird_h * 2) + self.__imageHeight - 1
+        # Instance the parameters
+        self.__background = background
+        self.__world = world
+        self.image_path = fp
 
-        # Creates and adds to the bottom tube body list, the tube mouth
-        tube2.append(self.__background.create_image(width, height, image=self.__background.tubeImages[1]))
+        # Receives the width and height of the background in pixels
+        self.__width, self.__height = world.getPixelSize(world.width, world.height)
 
-        # Sets the height of the body image of the bottom tube
-        height = self.__height - height
+        # Gets the width and height of the image in pixels
+        self.__imageWidth, self.__imageHeight = world.getPixelSize(world.tube_width, world.mouth_height)
 
-        # Creates a new image in the image list with the height being equal to the Y position of the bottom tube
-        self.__background.tubeImages[0][-1].append(
-            self.getPhotoImage(image=self.__background.tubeImages[2], width=self.__imageWidth, height=height)[0]
+        # Loads the image of the tube mouth
+        self.__mouth_image = Assets.getPhotoImage(
+            image_path=self.image_path[1], width=self.__imageWidth, height=self.__imageHeight
         )
 
-        # Sets the Y position of the bottom tube body
-        y = (self.__height - (height // 2)) + self.__imageHeight // 2
+        # Carries tube body image
+        self.__body_image = Assets.getImage(self.image_path[0], width=self.__imageWidth, height=self.__imageHeight)
 
-        # Creates and adds to the bottom tube body list, the tube body
-        tube2.append(self.__background.create_image(width, y, image=self.__background.tubeImages[0][-1][1]))
+        # The cache of tube body images is kept in the background, so it is reused by the next games
+        cache = getattr(self.__background, "tubeCache", None)
+        cache_size = cache_size or self.cache_size
 
-        # Adds the top and bottom tubes of position X to the list of tubes
-        self.__tubes.append([tube1, tube2])
+        if not cache or cache.step != self.__imageHeight:
+            cache = TubeImageCache(self.__body_image, self.__imageHeight, cache_size)
+            self.__background.tubeCache = cache
 
-        # Sets the distance to ZERO
-        self.__distance = 0
+        cache.size = cache_size
 
-    def deleteAll(self):
-        """ Method for descing all generated tubes """
+        self.__cache = cache
 
-        # Delete the tubes generated in the background
-        for tubes in self.__tubes:
-            for tube in tubes:
-                for body in tube:
-                    self.__background.delete(body)
-
-        self.__background.clear()
-        self.__background.tubeImages.clear()
+        self.__stop = False
 
-    @staticmethod
-    def getPhotoImage(image=None, image_path=None, width=None, height=None, closeAfter=False):
-        """ Returns an object of the PIL class. ImageTk.PhotoImage of an image and images created from PIL. Image (photoImage, new, original) 
-        @param image: Pil instance. Image.open 
-        @param image_path: Image Directory 
-        @param width: Image width 
-        @param height: Image height 
-        @param closeAfter: If True, the image will be closed after a PhotoImage is created of the same """
+        # Tubes of the world that are drawn, in the same order as in the world
+        self.__tubes = deque()
 
-        if not image:
-            if not image_path: return
+        # Distance scrolled by the world when the tubes were last drawn
+        self.__drawn_distance = world.toPixels(world.distance)
 
-            # Opens the image using its path
-            image = openImage(image_path)
+    def createNewTubes(self, tube, alpha=1, state=None):
+        """ Method to create the images of 2 new tubes (bottom and top) in the same Position X
+        @param tube: Tube of the world, or of the snapshot, that will be drawn
+        @param alpha: How far (0 to 1) the time is between the previous and the last tick of the world
+        @param state: Snapshot of the world that is drawn. If None, the world itself is drawn """
 
-        # The image is redded only if there is a width or height
-        if not width: width = image.width
-        if not height: height = image.height
+        pool = self.__background.pool
+        state = state or self.__world
 
-        # Creates a new image already resized
-        newImage = image.resize([width, height])
+        # Gets the X position of the tube, from the distance scrolled between the previous and the last tick,
+        # and the Y position of the mouth of the top and bottom tube in pixels
+        width = self.__world.toPixels(tube.offset - state.distanceAt(alpha))
+        height = self.__world.toPixels(tube.height)
+        bottom = self.__world.toPixels(tube.bottom)
 
-        # Create a photoImage
-        photoImage = PhotoImage(newImage)
+        # Gets images from the cache with the height being at least equal to the Y position of the top tube
+        # and to the space below the bottom tube
+        images = (self.__cache.get(height), self.__cache.get(self.__height - bottom))
 
-        # If closeAfter is True, it closes the images
-        if closeAfter:
-            # Closes the new image
-            newImage.close()
-            newImage = None
+        # Sets the Y position of the top tube body, so that its bottom stays behind the mouth
+        top_y = height + 1 - (self.__imageHeight // 2) - images[0].height() + (images[0].height() // 2)
 
-            # Closes the original image
-            image.close()
-            image = None
+        # Sets the Y position of the bottom tube body, so that its top stays behind the mouth
+        bottom_y = self.__height - ((self.__height - bottom) // 2) * 2 + (self.__imageHeight // 2) + \
+            (images[1].height() // 2)
 
-# Returns the PhotoImage of the image, the new image that was used, and the original image
-        return photoImage, newImage, image
+        # Creates the mouth and the body of the top tube and of the bottom tube
+        items = (
+            pool.acquire(width, height, self.__mouth_image, (self.__tag, )),
+            pool.acquire(width, top_y, images[0], (self.__tag, )),
+            pool.acquire(width, bottom, self.__mouth_image, (self.__tag, )),
+            pool.acquire(width, bottom_y, images[1], (self.__tag, ))
+        )
 
-    def move(self):
-        """ Method for moving all tubes """
+        # Adds the tube to the list of drawn tubes
+        self.__tubes.append(DrawnTube(tube.offset, items, images))
 
-        # Creates an auxilar variable to check if the scoring method has been executed
-        scored = False
+    def deleteAll(self):
+        """ Method for descing all generated tubes """
 
-        # Moves the generated tubes in the background
-        for tubes in self.__tubes:
-            for tube in tubes:
+        # Hides the tubes generated in the background, so that they can be reused
+        while self.__tubes:
+            self.deleteTube(self.__tubes.popleft())
 
-                # Check to see if the bird's past the tube. If yes, the method for scoring will run
-                if not scored:
+    def deleteTube(self, tube):
+        """ Method to hide the images of a drawn tube, so that they can be reused """
 
-                    # Receives the position of the barrel
-                    x2 = self.__background.bbox(tube[0])[2]
+        for item in tube.items:
+            self.__background.pool.release(item)
 
-                    # If the "x2" position of the tube is smaller than the "x1" position of the bird and if it has not yet been 
-                    # Punctuated this same barrel, the method to score will be called.
+    def move(self, alpha=1, state=None):
+        """ Method for moving all tubes to their position in the world
+        @param alpha: How far (0 to 1) the time is between the previous and the last tick of the world
+        @param state: Snapshot of the world that is drawn. If None, the world itself is drawn """
 
-                    if (self.__width / 2) - (self.__bird_w / 2) - self.__move < x2:
-                        if x2 <= (self.__width / 2) - (self.__bird_w / 2):
+        state = state or self.__world
 
-                            # Checks if the tube is in the list of past tubes
-                            if not tube[0] in self.__pastTubes:
-                                # Calls the method to score and adds the punctuated tube to the list of passed tubes
-                                self.__score_method()
-                                self.__pastTubes.append(tube[0])
-                                scored = True
+        # All the tubes move at the same speed, so the distance scrolled by the world between
+        # the previous and the last tick gives how much all of them have moved since they were last drawn
+        distance = self.__world.toPixels(state.distanceAt(alpha))
+        distance, self.__drawn_distance = distance - self.__drawn_distance, distance
 
-                # Moves each part of the tube cup in the background
-                for body in tube:
-                    self.__background.move(body, -self.__move, 0)
+        # Moves all parts of all tubes in the background at once
+        if distance:
+            self.__background.move(self.__tag, -distance, 0)
 
-    def run(self):
-        """ Method to generate the tubes in the background and make your animation in an infinite loop """
+    def run(self, alpha=1, state=None):
+        """ Method to draw the tubes of the world in the background
+        @param alpha: How far (0 to 1) the time is between the previous and the last tick of the world
+        @param state: Snapshot of the world that is drawn. If None, the world itself is drawn """
 
-        # If the "stop" method has been called, the animation is terminated
+        # If the "stop" method has been called, the tubes are no longer drawn
         if self.__stop: return
 
-        # If the tubes (up and down) of an X position have disappeared from the background area, 
-        # they will be deleted along with your images and all your data.
-
-        if len(self.__tubes) >= 1 and self.__background.bbox(self.__tubes[0][0][0])[2] <= 0:
-
-            # Erases the entire tube body inside the background
-            for tube in self.__tubes[0]:
-                for body in tube:
-                    self.__background.delete(body)
-
-            # Removes the tubes (up and down) from the list of tubes
-            self.__background.tubeImages[0].remove(self.__background.tubeImages[0][0])
-
-            # Removes the tube body image from the image list
-            self.__tubes.remove(self.__tubes[0])
-
-            # Removes the first object from the list of passed tubes
-            self.__pastTubes.remove(self.__pastTubes[0])
-
-        # If the distance between the last tube created and the "x2" side of the background is greater than the distance 
-        # Minimum set, then a new tube will be created.
+        tubes = (state or self.__world).tubes
 
-        if self.__distance >= self.__minDistance:
-            self.createNewTubes()
-        else:
-            # Increases distance as tubes move
-            self.__distance += self.__move
+        # If the tubes (up and down) of an X position have been removed from the world, their images are hidden.
+        # The positions X of the tubes never repeat, so they identify the tubes in the world and in its snapshots
+        while self.__tubes and (not tubes or self.__tubes[0].offset != tubes[0].offset):
+            self.deleteTube(self.__tubes.popleft())
 
         # Move the tubes
-        self.move()
+        self.move(alpha, state)
 
-        # Reruns the method at a certain time
-        self.__background.after(self.__animation_speed, self.run)
+        # Creates the images of the tubes that were created in the world already in their positions
+        for index in range(len(self.__tubes), len(tubes)):
+            self.createNewTubes(tubes[index], alpha, state)
 
     def stop(self):
         """
-        Método para interromper a Thread
+        Method to stop drawing the tubes
         """
 
         self.__stop = True
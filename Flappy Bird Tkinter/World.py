@@ -0,0 +1,342 @@
+from collections import deque, namedtuple
+from random import Random
+
+from Collision import outside, overlaps, shrink
+
+
+class Tube(object):
+    """ Class with the state of a pair of tubes (top and bottom) in the same position X """
+
+    __slots__ = ("offset", "height", "bottom", "scored")
+
+    def __init__(self, offset, height, bottom):
+
+        # Position X of the center of the tubes, measured from the start of the scroll of the world
+        self.offset = offset
+
+        # Position Y of the mouth of the top tube and of the bottom tube
+        self.height = height
+        self.bottom = bottom
+
+        # Whether the bird has already passed this tube
+        self.scored = False
+
+
+# Immutable copy of a Tube, which can be read by another thread while the world keeps changing
+TubeSnapshot = namedtuple("TubeSnapshot", "offset height bottom scored")
+
+
+class Interpolated(object):
+    """ Class with the methods shared by the World and its snapshots to draw them between two ticks """
+
+    __slots__ = ()
+
+    def distanceAt(self, alpha=1):
+        """ Method to return the distance scrolled by the world between the previous and the last tick
+        @param alpha: How far (0 to 1) the time is between the previous and the last tick """
+
+        return self.previous_distance + (self.distance - self.previous_distance) * alpha
+
+
+class Snapshot(namedtuple("Snapshot", (
+    "ticks", "bird_x", "bird_y", "previous_y", "distance", "previous_distance", "tubes", "alive", "cause", "score",
+    "time", "step_time"
+)), Interpolated):
+    """ Immutable copy of the state of a World after a tick, with the attributes used to draw it.
+    It also has the time in which the tick was due and the time in milliseconds that it took. """
+
+    __slots__ = ()
+
+
+class World(Interpolated):
+    """ Class with the whole state of a game, advanced one tick at a time without any display.
+    Positions and sizes are in world units, where the height of the screen always has the same number of units,
+    so the game is the same in any resolution with the same aspect ratio. """
+
+    # Height of the screen in world units. The units are the pixels of a 1080p screen
+    units = 1080
+
+    # Bird physics, as a fraction of the screen height
+    decends = 0.00390625
+    climbsUp = 0.0911458333
+    acceleration = 0.05
+
+    # Distance in world units that the tubes move at each tube animation
+    tube_move = 10
+
+    # Time in milliseconds that the bird takes to climb one world unit
+    climb_speed = 3
+
+    # Time in milliseconds of a descent of the bird and of a tube animation, the ones of a 1920x1080 screen
+    descend_speed = 3
+    animation_speed = 37
+
+    def __init__(self, *screen_geometry, descend_speed=None, animation_speed=None, tick=None, course=None, seed=None):
+
+        # Receives the width and height of the screen in pixels and converts them to world units
+        self.width, self.height = self.getSize(*screen_geometry)
+
+        # Number of pixels of the screen in a world unit
+        self.scale = screen_geometry[1] / self.units
+
+        # The speeds are the same in every resolution, unless others are given
+        descend_speed = descend_speed or self.descend_speed
+        animation_speed = animation_speed or self.animation_speed
+
+        # Sets the descent and climb of the bird based on the height of the screen
+        self.decends = int(self.decends * self.height + 0.5)
+        self.climbsUp = int(self.climbsUp * self.height + 0.5)
+
+        # Calculates bird size based on screen width and height
+        self.bird_width = (self.width // 100) * 6
+        self.bird_height = (self.height // 100) * 11
+
+        # Calculates the size of the tube images
+        self.tube_width = (self.width // 100) * 10
+        self.mouth_height = (self.height // 100) * 5
+
+        # Gives x pixels bird a margin of error (left, top, right, bottom)
+        self.hitbox_margins = (
+            int(25 / 78 * self.bird_width), int(25 / 77 * self.bird_height),
+            int(20 / 78 * self.bird_width), int(10 / 77 * self.bird_width)
+        )
+
+        # Calculates the minimum distance between the tubes
+        self.min_distance = int(self.tube_width * 4.5)
+
+        # Seed of the random generator of the tubes. If None, a different one is used in each game
+        self.seed = seed
+
+        # Sequence with the Y positions of the top tubes that will be created, in order. When
+        # it is None or all of them have been used, the positions are chosen randomly
+        self.course = course
+
+        # If no tick duration (in milliseconds) is given, a tick lasts as long as a descent of the bird
+        if not tick: tick = descend_speed
+        self.tick = tick
+
+        # Converts the speeds, given per descent and per tube animation, to speeds per tick
+        self.descend_scale = tick / descend_speed
+        self.tube_speed = self.tube_move * tick / animation_speed
+
+        # Upward speed given to the bird by a jump, in pixels per descent
+        self.jump_velocity = descend_speed / self.climb_speed
+
+        self.reset()
+
+    @classmethod
+    def getSize(cls, width, height):
+        """ Method to return the size (width, height) in world units of a screen, keeping its aspect ratio
+        @param width: Width of the screen in pixels
+        @param height: Height of the screen in pixels """
+
+        return int(round(width * cls.units / height)), cls.units
+
+    def getPixelSize(self, width, height):
+        """ Method to return the size in whole pixels (width, height) of an image with the size in world units """
+
+        return max(1, int(round(width * self.scale))), max(1, int(round(height * self.scale)))
+
+    def toPixels(self, value):
+        """ Method to convert a position or distance in world units to pixels of the screen """
+
+        return value * self.scale
+
+    def randomHeight(self, rng=None):
+        """ Method to return a Y position for the mouth of a top tube, chosen randomly respecting some rules that are:
+        Space for the bird to pass and space to add the bottom tube.
+        @param rng: Instance of random.Random used, or the generator of the world if None """
+
+        return (rng or self.rng).randint(
+            self.mouth_height // 2, self.height - (self.bird_height * 2) - self.mouth_height
+        )
+
+    def reset(self, seed=None):
+        """ Method to put the world back in its initial state
+        @param seed: Seed of the random generator of the tubes. If None, the seed of the world is used """
+
+        if seed is not None: self.seed = seed
+
+        # Each game has its own random generator, so the same seed always creates the same tubes
+        self.rng = Random(self.seed)
+
+        # Bird state
+        self.bird_x = self.width // 2
+        self.bird_y = self.height // 2
+        self.previous_y = self.bird_y
+        self.velocity = 0
+        self.alive = True
+        self.cause = None
+        self.__climb_left = 0
+
+        # Tubes state, sorted by position X. Index of the first tube that the bird has not yet passed
+        self.tubes = deque()
+        self.__distance = 0
+        self.__next_tube = 0
+        self.__course_index = 0
+
+        # Total distance scrolled by the tubes, in the previous and in the last tick
+        self.previous_distance = 0
+        self.distance = 0
+
+        # Game state
+        self.score = 0
+        self.ticks = 0
+
+    def birdBox(self):
+        """ Method to return the rectangle (x1, y1, x2, y2) occupied by the bird image """
+
+        x1 = self.bird_x - self.bird_width // 2
+        y1 = self.bird_y - self.bird_height // 2
+
+        return x1, y1, x1 + self.bird_width, y1 + self.bird_height
+
+    def tubeBoxes(self, tube):
+        """ Method to return the rectangles (x1, y1, x2, y2) occupied by the top and bottom tube """
+
+        x1 = self.tubeX(tube) - self.tube_width // 2
+        x2 = x1 + self.tube_width
+
+        # The top tube goes from above the screen to the bottom of its mouth
+        top = (x1, float("-inf"), x2, tube.height + self.mouth_height // 2)
+
+        # The bottom tube goes from the top of its mouth to below the screen
+        bottom = (x1, tube.bottom - self.mouth_height // 2, x2, float("inf"))
+
+        return top, bottom
+
+    def tubeX(self, tube, alpha=1):
+        """ Method to return the position X of the center of the tube
+        @param alpha: How far (0 to 1) the time is between the previous and the last tick """
+
+        return tube.offset - self.distanceAt(alpha)
+
+    def snapshot(self, time=0, step_time=0):
+        """ Method to return an immutable copy of the state of the world
+        @param time: Time in seconds in which the last tick was due
+        @param step_time: Time in milliseconds that the last tick took """
+
+        return Snapshot(
+            self.ticks, self.bird_x, self.bird_y, self.previous_y, self.distance, self.previous_distance,
+            tuple(TubeSnapshot(tube.offset, tube.height, tube.bottom, tube.scored) for tube in self.tubes),
+            self.alive, self.cause, self.score, time, step_time
+        )
+
+    def checkCollision(self):
+        """ Method to check if the bird has crossed the edge of the screen or collided with a tube """
+
+        position = self.birdBox()
+
+        # If the bird has crossed the bottom or top edge of the screen, it will be declared dead
+        if outside(position, self.height):
+            self.alive = False
+            self.cause = "ceiling" if position[1] <= 0 else "floor"
+
+        position = shrink(position, self.hitbox_margins)
+
+        # The tubes are far apart, so only the last tube passed and the next one can reach the bird
+        for index in range(max(0, self.__next_tube - 1), min(len(self.tubes), self.__next_tube + 1)):
+
+            # If the bird overlaps the top or bottom tube, it dies
+            for box in self.tubeBoxes(self.tubes[index]):
+                if overlaps(position, box):
+                    self.alive = False
+                    self.cause = "tube"
+
+        return not self.alive
+
+    def getMaxTubes(self):
+        """ Method to return the maximum number of tubes that can exist in the world at the same time """
+
+        return int((self.width + self.tube_width * 2) // self.min_distance) + 2
+
+    def createCourse(self, length, rng=None):
+        """ Method to return a tuple with the Y positions of the next top tubes, which can be used as a course
+        @param length: Number of tubes
+        @param rng: Instance of random.Random used, or the generator of the world if None """
+
+        return tuple(self.randomHeight(rng) for i in range(length))
+
+    def createNewTubes(self):
+        """ Method to create a new pair of tubes just after the right edge of the screen """
+
+        # Gets the Y position of the tube from the course, if there is one
+        if self.course is not None and self.__course_index < len(self.course):
+            height = self.course[self.__course_index]
+            self.__course_index += 1
+        else:
+            height = self.randomHeight()
+
+        # The space between the tubes is calculated based on the size of the bird
+        bottom = height + (self.bird_height * 2) + self.mouth_height - 1
+
+        self.tubes.append(Tube(self.width + self.tube_width + self.distance, height, bottom))
+
+        # Sets the distance to ZERO
+        self.__distance = 0
+
+    def step(self, jump=False):
+        """ Method to advance the world by one tick. Returns True if the bird has passed a tube in this tick.
+        @param jump: If True, the bird starts to rise in this tick """
+
+        # A dead bird does not move anymore
+        if not self.alive: return False
+
+        self.ticks += 1
+
+        # Saves the positions of the previous tick
+        self.previous_y = self.bird_y
+        self.previous_distance = self.distance
+
+        # A jump gives the bird an upward speed until it climbs the ascent limit.
+        # Jumping again while rising starts a new climb from the current position.
+        if jump:
+            self.velocity = -self.jump_velocity
+            self.__climb_left = self.climbsUp
+
+        # Move the bird up while the ascent limit of the jump has not been reached
+        if self.__climb_left > 0:
+            climb = min(-self.velocity * self.descend_scale, self.__climb_left)
+            self.bird_y -= climb
+            self.__climb_left -= climb
+
+            # At the top of the jump the bird stops and starts to fall
+            if self.__climb_left <= 0:
+                self.velocity = 0
+
+        else:
+            # As long as the bird has not reached its maximum speed, the speed will increase
+            if self.velocity < self.decends:
+                self.velocity += self.acceleration * self.descend_scale
+
+            self.bird_y += self.velocity * self.descend_scale
+
+        # Removes the tubes that have left the screen
+        if self.tubes and self.tubeX(self.tubes[0]) + self.tube_width // 2 <= 0:
+            self.tubes.popleft()
+            self.__next_tube = max(0, self.__next_tube - 1)
+
+        # Creates a new tube when the last one is far enough, otherwise increases the distance
+        if self.__distance >= self.min_distance:
+            self.createNewTubes()
+        else:
+            self.__distance += self.tube_speed
+
+        # Moves all tubes at once, since their positions are measured from the scroll of the world
+        self.distance += self.tube_speed
+
+        # Checks if the bird has passed the next tube
+        scored = False
+
+        if self.__next_tube < len(self.tubes):
+            tube = self.tubes[self.__next_tube]
+
+            if self.tubeX(tube) + self.tube_width // 2 <= self.bird_x - self.bird_width / 2:
+                tube.scored = True
+                scored = True
+                self.score += 1
+                self.__next_tube += 1
+
+        self.checkCollision()
+
+        return scored
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules of the game are in the parent directory and are imported by their names, as the game does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
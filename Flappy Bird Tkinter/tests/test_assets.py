@@ -0,0 +1,50 @@
+import os
+
+import pytest
+from PIL.Image import new as newImage
+
+from Assets import Assets
+
+
+@pytest.fixture
+def image_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(Assets, "cache_fp", str(tmp_path / "cache"))
+    monkeypatch.setattr(Assets, "atlas", None)
+
+    path = str(tmp_path / "red.png")
+    newImage("RGB", (8, 4), (255, 0, 0)).save(path)
+
+    yield path
+    Assets.clear()
+
+
+def test_images_are_loaded_once_and_shared(image_path):
+    image = Assets.getImage(image_path, 4, 2)
+
+    assert image.size == (4, 2)
+    assert Assets.getImage(image_path, 4, 2) is image
+
+    # The size of the original image is used when the size is not given
+    assert Assets.getImage(image_path).size == (8, 4)
+
+
+def test_resized_images_are_read_back_from_the_disk(image_path):
+    Assets.getImage(image_path, 4, 2)
+    assert len(os.listdir(Assets.cache_fp)) == 1
+
+    Assets.clear()
+    image = Assets.getImage(image_path, 4, 2)
+
+    assert image.size == (4, 2)
+    assert image.getpixel((0, 0)) == (255, 0, 0)
+
+
+def test_clear_keeps_the_images_already_returned(image_path):
+    image = Assets.getImage(image_path, 4, 2)
+    strip = Assets.getStripImage(image_path, 4, 2, 3)
+
+    Assets.useAtlas(None)
+
+    assert image.getpixel((3, 1)) == (255, 0, 0)
+    assert strip.size == (12, 2)
+    assert strip.getpixel((11, 1)) == (255, 0, 0)
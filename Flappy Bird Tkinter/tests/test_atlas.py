@@ -0,0 +1,74 @@
+import os
+
+from PIL.Image import new as newImage
+
+from Atlas import Atlas
+
+
+def test_pack_places_the_images_without_overlaps():
+    sizes = {"a": (50, 40), "b": (30, 60), "c": (80, 10), "d": (20, 20), "e": (45, 45)}
+    rects, (width, height) = Atlas.pack(sizes, padding=1)
+
+    assert set(rects) == set(sizes)
+
+    for path, (x, y, w, h) in rects.items():
+        assert (w, h) == sizes[path]
+        assert x >= 0 and y >= 0 and x + w <= width and y + h <= height
+
+    # The images do not overlap, including their padding
+    boxes = list(rects.values())
+
+    for index, first in enumerate(boxes):
+        for second in boxes[index + 1:]:
+            assert first[0] + first[2] + 1 <= second[0] or second[0] + second[2] + 1 <= first[0] or \
+                first[1] + first[3] + 1 <= second[1] or second[1] + second[3] + 1 <= first[1]
+
+
+def test_pack_fits_the_widest_image():
+    rects, (width, height) = Atlas.pack({"wide": (500, 5), "small": (5, 5)})
+
+    assert width >= 500
+    assert rects["wide"] == (0, 0, 500, 5)
+
+
+def createImages(directory):
+    paths = []
+
+    for name, size, color in (("red", (30, 20), (255, 0, 0, 255)), ("blue", (10, 40), (0, 0, 255, 255))):
+        path = os.path.join(str(directory), name + ".png")
+        newImage("RGBA", size, color).save(path)
+        paths.append(path)
+
+    return paths
+
+
+def test_build_keeps_the_images_in_the_atlas(tmp_path):
+    red, blue = createImages(tmp_path)
+    Atlas(str(tmp_path / "atlas.png"), str(tmp_path / "atlas.json")).build([red, blue])
+
+    atlas = Atlas(str(tmp_path / "atlas.png"), str(tmp_path / "atlas.json")).load()
+
+    assert atlas.has(red) and atlas.has(blue)
+    assert atlas.getHeader(blue) == ("RGBA", (10, 40))
+
+    image = atlas.getImage(red)
+    assert image.size == (30, 20)
+    assert image.getpixel((29, 19)) == (255, 0, 0, 255)
+
+
+def test_modified_images_are_not_taken_from_the_atlas(tmp_path):
+    red, blue = createImages(tmp_path)
+    Atlas(str(tmp_path / "atlas.png"), str(tmp_path / "atlas.json")).build([red, blue])
+
+    stat = os.stat(blue)
+    os.utime(blue, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    atlas = Atlas(str(tmp_path / "atlas.png"), str(tmp_path / "atlas.json")).load()
+
+    assert atlas.has(red) and not atlas.has(blue)
+
+
+def test_missing_atlas_has_no_images(tmp_path):
+    atlas = Atlas(str(tmp_path / "atlas.png"), str(tmp_path / "atlas.json")).load()
+
+    assert atlas.sprites == {}
@@ -0,0 +1,33 @@
+from Benchmark import Benchmark
+
+
+def report(**medians):
+    return {"results": {name: {"median_us": median, "min_us": median, "calls": 1} for name, median in medians.items()}}
+
+
+def test_compare_finds_the_regressions():
+    comparison = Benchmark.compare(report(a=100, b=100, c=100), report(a=105, b=120, c=50), threshold=0.1)
+
+    assert comparison == [("a", 100, 105, 1.05, False), ("b", 100, 120, 1.2, True), ("c", 100, 50, 0.5, False)]
+
+
+def test_compare_skips_the_benchmarks_not_in_the_baseline():
+    comparison = Benchmark.compare(report(a=10), report(a=10, new=5))
+
+    assert [item[0] for item in comparison] == ["a"]
+
+
+def test_compare_with_a_zero_baseline():
+    assert Benchmark.compare(report(a=0), report(a=1))[0][3:] == (float("inf"), True)
+
+
+def test_measure_keeps_the_result():
+    benchmark = Benchmark(repeat=2)
+    calls = []
+
+    result = benchmark.measure("append", lambda: calls.append(1), 3, setup=lambda: calls.append(0))
+
+    assert calls == [0, 1] * 6
+    assert result["calls"] == 6
+    assert 0 <= result["min_us"] <= result["median_us"]
+    assert benchmark.report()["results"] == {"append": result}
@@ -0,0 +1,19 @@
+from Collision import outside, overlaps, shrink
+
+
+def test_overlaps_counts_touching_edges():
+    assert overlaps((0, 0, 10, 10), (10, 10, 20, 20))
+    assert overlaps((0, 0, 10, 10), (5, -5, 6, 50))
+    assert not overlaps((0, 0, 10, 10), (11, 0, 20, 10))
+    assert not overlaps((0, 0, 10, 10), (0, 11, 10, 20))
+
+
+def test_shrink():
+    assert shrink((0, 0, 100, 50), (1, 2, 3, 4)) == (1, 2, 97, 46)
+
+
+def test_outside_uses_the_tolerance():
+    assert not outside((0, -19, 10, 10), 100)
+    assert outside((0, -20, 10, 10), 100)
+    assert not outside((0, 50, 10, 119), 100)
+    assert outside((0, 50, 10, 120), 100)
@@ -0,0 +1,51 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Environment import Environment
+from Policies import policies
+from World import World
+
+
+def test_environment_follows_the_rules_of_the_world():
+    from random import Random
+
+    world = World(1920, 1080, tick=1000 / 60)
+    course = world.createCourse(200, Random(9))
+    world.course = course
+
+    environment = Environment(1, 1920, 1080, tick_rate=60)
+    environment.reset(course=course)
+
+    rng = Random(0)
+
+    while world.alive and world.ticks < 5000:
+        jump = policies["gap"](world, rng)
+        world.step(jump)
+        observation, reward, done, info = environment.step(np.array([int(jump)]))
+
+        assert bool(done[0]) == (not world.alive)
+        assert info["score"][0] == world.score
+        assert info["ticks"][0] == world.ticks
+
+        if world.alive:
+            assert environment.bird_y[0] == pytest.approx(world.bird_y)
+            assert environment.velocity[0] == pytest.approx(world.velocity)
+
+    assert world.score > 0
+
+
+def test_every_game_follows_the_course():
+    environment = Environment(2, 1920, 1080, tick_rate=60)
+    environment.reset(seed=1, course=(420, 430))
+
+    # The birds stay in the middle of the screen until the tubes reach them
+    while environment.tube_valid.sum(axis=1).min() < 2:
+        observation, reward, done, info = environment.step(environment.bird_y > 560)
+        assert not done.any()
+
+    assert environment.tube_height[:, :2].tolist() == [[420, 430], [420, 430]]
+
+    # Without a course, the positions are random again
+    environment.reset(seed=1)
+    assert environment.course is None
@@ -0,0 +1,117 @@
+from random import Random
+from time import perf_counter, sleep
+from tkinter import Tk
+
+import pytest
+
+from GameLoop import GameLoop
+from Policies import followGap
+from Simulation import Simulation
+from World import World
+
+
+class FakeTk(Tk):
+    """ Tk that only runs the callbacks of "after" in real time, without a window """
+
+    def __init__(self):
+        self.pending = {}
+        self.count = 0
+
+    def after(self, ms, func=None, *args):
+        self.count += 1
+        self.pending["after#{}".format(self.count)] = (perf_counter() + ms / 1000, func, args)
+        return "after#{}".format(self.count)
+
+    def after_cancel(self, identifier):
+        self.pending.pop(identifier, None)
+
+    def run(self, until):
+        """ Runs the callbacks when they are due until the condition is true or nothing is pending """
+
+        while self.pending and not until():
+            identifier = min(self.pending, key=lambda key: self.pending[key][0])
+            due, func, args = self.pending.pop(identifier)
+            sleep(max(0, due - perf_counter()))
+            func(*args)
+
+
+class Game(object):
+    """ Plays a world with the gap policy, counting the new ticks drawn by each frame """
+
+    def __init__(self, tick_rate=100, interpolate=False, frames=60):
+        self.tk = FakeTk()
+        self.world = World(1920, 1080, tick=1000 / tick_rate, seed=1)
+        self.frames = frames
+        self.ticks = []
+        self.alphas = []
+        self.new = 0
+
+        rng = Random(0)
+        self.simulation = Simulation(self.world, lambda world: followGap(world, rng), tick_rate)
+        self.loop = GameLoop(self.tk, self.update, self.render, frame_rate=tick_rate, interpolate=interpolate)
+
+    def update(self, snapshot):
+        self.new += 1
+
+    def render(self, alpha):
+        self.ticks.append(self.new)
+        self.alphas.append(alpha)
+        self.new = 0
+
+    def play(self):
+        self.loop.start(self.simulation)
+        self.tk.run(lambda: len(self.ticks) > self.frames)
+        self.loop.stop()
+
+
+def test_frames_without_interpolation_draw_one_tick_each():
+    game = Game()
+    game.play()
+
+    # The first frame may also draw the ticks executed while the loop started
+    assert game.world.alive
+    assert set(game.alphas) == {1}
+    assert game.ticks[1:].count(1) >= 0.9 * game.frames
+
+
+def test_frames_with_interpolation_draw_between_the_ticks():
+    game = Game(interpolate=True)
+    game.play()
+
+    assert all(0 <= alpha <= 1 for alpha in game.alphas)
+    assert len(set(game.alphas)) > 1
+
+
+def test_the_loop_stops_when_the_update_returns_false():
+    tk = FakeTk()
+    world = World(1920, 1080, tick=10, seed=1)
+    loop = GameLoop(tk, lambda snapshot: snapshot.ticks < 5, lambda alpha: None, frame_rate=100)
+
+    loop.start(Simulation(world, lambda world: False, 100))
+    tk.run(lambda: not loop.isRunning())
+
+    assert not loop.isRunning()
+    assert not tk.pending
+
+
+def test_pause_cancels_only_the_timer_of_the_loop():
+    game = Game()
+    game.tk.after(10 ** 6, print)
+    game.loop.start(game.simulation)
+    game.loop.pause()
+
+    assert game.loop.isPaused() and game.simulation.isPaused()
+    assert len(game.tk.pending) == 1
+
+    game.loop.resume()
+    game.tk.run(lambda: len(game.ticks) > 5)
+    game.loop.stop()
+
+    assert game.ticks[1:].count(1) >= 4
+
+
+def test_needs_valid_arguments():
+    with pytest.raises(TypeError):
+        GameLoop(None, print, print)
+    with pytest.raises(ValueError):
+        GameLoop(FakeTk(), print, print, frame_rate=0)
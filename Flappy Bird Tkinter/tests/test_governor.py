@@ -0,0 +1,36 @@
+import pytest
+
+from Governor import Governor
+
+LEVELS = [("high", 10), ("medium", 20), ("low", 40)]
+
+
+def test_levels_change_only_after_a_full_window():
+    governor = Governor(LEVELS, window=10)
+
+    assert [governor.update(15) for i in range(9)] == [None] * 9
+    assert governor.update(15) == "medium"
+    assert governor.getName() == "medium"
+
+
+def test_moves_down_while_slow_and_up_when_fast():
+    governor = Governor(LEVELS, window=10, headroom=0.5)
+
+    changes = [governor.update(50) for i in range(30)]
+    assert [change for change in changes if change] == ["medium", "low"]
+
+    changes = [governor.update(4) for i in range(30)]
+    assert [change for change in changes if change] == ["medium", "high"]
+
+
+def test_stays_when_the_frames_fit():
+    governor = Governor(LEVELS, level=1, window=10, headroom=0.5)
+
+    # Fits in the budget of the level, but not well enough in the level above
+    assert not any(governor.update(8) for i in range(50))
+    assert governor.getName() == "medium"
+
+
+def test_needs_a_level():
+    with pytest.raises(ValueError):
+        Governor([])
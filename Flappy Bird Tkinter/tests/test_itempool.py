@@ -0,0 +1,88 @@
+from tkinter import Canvas
+
+import pytest
+
+from ItemPool import ItemPool
+
+
+class FakeCanvas(Canvas):
+    """ Canvas that keeps its items in a list, in their stacking order, without a window of Tk """
+
+    def __init__(self):
+        self.items = {}
+        self.order = []
+        self.created = 0
+
+    def create_image(self, x, y, image=None, tags=()):
+        self.created += 1
+        self.items[self.created] = {"coords": (x, y), "image": image, "tags": tuple(tags), "state": "normal"}
+        self.order.append(self.created)
+        return self.created
+
+    def coords(self, item, x, y):
+        self.items[item]["coords"] = (x, y)
+
+    def find_withtag(self, tag):
+        return tuple(item for item in self.order if tag == item or tag in self.items[item]["tags"])
+
+    def itemconfig(self, tag, **options):
+        for item in self.find_withtag(tag):
+            self.items[item].update(options)
+
+    def tag_lower(self, item, below):
+        self.order.remove(item)
+        self.order.insert(self.order.index(self.find_withtag(below)[0]), item)
+
+
+@pytest.fixture
+def canvas():
+    return FakeCanvas()
+
+
+def test_released_items_are_hidden_and_reused(canvas):
+    pool = ItemPool(canvas)
+    first = pool.acquire(1, 2, "a", ("tube", ))
+    pool.release(first)
+
+    assert canvas.items[first]["state"] == "hidden"
+    assert canvas.items[first]["tags"] == ("pooled", )
+
+    assert pool.acquire(3, 4, "b", ("tube", )) == first
+    assert canvas.items[first] == {"coords": (3, 4), "image": "b", "tags": ("pooled", "tube"), "state": "normal"}
+    assert canvas.created == len(pool) == 1
+
+
+def test_release_all_hides_every_item(canvas):
+    pool = ItemPool(canvas)
+    items = [pool.acquire(0, 0, "a") for i in range(3)]
+    pool.releaseAll()
+
+    assert all(canvas.items[item]["state"] == "hidden" for item in items)
+    assert sorted(pool.acquire(0, 0, "a") for i in range(4)) == items + [4]
+    assert len(pool) == 4
+
+
+def test_release_ignores_items_not_in_use(canvas):
+    pool = ItemPool(canvas)
+    item = pool.acquire(0, 0, "a")
+    pool.release(item)
+    pool.release(item)
+
+    assert [pool.acquire(0, 0, "a"), pool.acquire(0, 0, "a")] == [item, 2]
+
+
+def test_new_items_are_placed_below_the_tag(canvas):
+    pool = ItemPool(canvas)
+    pool.below = "bird"
+
+    # Without an item with the tag, the items are placed above the others
+    first = pool.acquire(0, 0, "a")
+    bird = canvas.create_image(0, 0, "bird", ("bird", ))
+    second = pool.acquire(0, 0, "a")
+
+    assert canvas.order == [first, second, bird]
+
+
+def test_needs_a_canvas():
+    with pytest.raises(TypeError):
+        ItemPool(None)
@@ -0,0 +1,83 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from Leaderboard import Leaderboard
+
+
+def timestamp(day, hour=12):
+    return datetime.strptime("{} {}".format(day, hour), "%Y-%m-%d %H").timestamp()
+
+
+@pytest.fixture
+def leaderboard(tmp_path):
+    leaderboard = Leaderboard(str(tmp_path / "data" / "scores.db"), flush_interval=0.01)
+    yield leaderboard
+    leaderboard.close()
+
+
+def test_games_are_written_by_flush(leaderboard):
+    assert leaderboard.best() == 0
+    assert leaderboard.count() == 0
+
+    leaderboard.add(3, 10.5, seed=7, ticks=600, timestamp=timestamp("2026-01-01"))
+    leaderboard.add(9, 20, timestamp=timestamp("2026-01-02"))
+    leaderboard.add(5, 15, timestamp=timestamp("2026-01-02", 13))
+    leaderboard.flush()
+
+    assert leaderboard.best() == 9
+    assert leaderboard.count() == 3
+    assert leaderboard.top(1) == [{
+        "score": 9, "duration": 20, "seed": None, "ticks": None, "timestamp": timestamp("2026-01-02"),
+        "day": "2026-01-02"
+    }]
+
+
+def test_top_of_a_day(leaderboard):
+    for score, day in ((1, "2026-01-01"), (4, "2026-01-01"), (8, "2026-01-02"), (4, "2026-01-01")):
+        leaderboard.add(score, 1, timestamp=timestamp(day))
+
+    leaderboard.flush()
+
+    assert [game["score"] for game in leaderboard.top(day="2026-01-01")] == [4, 4, 1]
+    assert [game["score"] for game in leaderboard.top(2, day=datetime(2026, 1, 2).date())] == [8]
+    assert leaderboard.top(day="2026-01-03") == []
+
+
+def test_games_are_kept_when_the_database_is_opened_again(tmp_path):
+    fp = str(tmp_path / "scores.db")
+
+    leaderboard = Leaderboard(fp)
+    leaderboard.add(6, 30)
+    leaderboard.close()
+
+    leaderboard = Leaderboard(fp)
+    leaderboard.add(2, 10)
+    leaderboard.flush()
+
+    assert leaderboard.count() == 2
+    assert leaderboard.best() == 6
+    leaderboard.close()
+
+
+def test_errors_do_not_stop_the_writer(leaderboard, caplog):
+    # A game without a score cannot be saved
+    leaderboard.add(None, 1)
+    leaderboard.flush()
+
+    assert "could not be saved" in caplog.text
+
+    leaderboard.add(5, 1)
+    leaderboard.flush()
+
+    assert leaderboard.count() == 1
+
+
+def test_close_closes_the_database(tmp_path):
+    leaderboard = Leaderboard(str(tmp_path / "scores.db"))
+    leaderboard.close()
+    leaderboard.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        leaderboard.count()
@@ -0,0 +1,98 @@
+import json
+
+from Profiler import Histogram, Profiler
+
+
+def test_profiler_frame_returns_the_time_of_the_parts():
+    profiler = Profiler()
+    profiler.add("a", 1.5)
+    profiler.add("a", 0.5)
+    profiler.add("b", 1)
+
+    assert profiler.frame() == 3
+    assert profiler.frame() == 0
+    assert profiler.sections["a"][0] == 2
+
+
+def test_percentile_uses_the_nearest_rank():
+    values = list(range(1, 101))
+
+    assert Profiler.percentile(values, 50) == 50
+    assert Profiler.percentile(values, 99) == 99
+    assert Profiler.percentile([], 50) == 0
+
+
+def test_wrap_measures_the_function_and_returns_its_result():
+    profiler = Profiler()
+    jump = profiler.wrap("jump", lambda event: event * 2)
+
+    assert jump(21) == 42
+    assert profiler.frame() >= 0
+    assert len(profiler.sections["jump"]) == 1
+
+
+def test_stats_of_the_last_frames():
+    profiler = Profiler(size=3, counter=lambda: 7)
+
+    assert profiler.stats()["fps"] == 0
+
+    for i in range(5):
+        profiler.add("tick", i)
+        profiler.frame()
+
+    stats = profiler.stats()
+
+    assert len(profiler.frame_times) == 3
+    assert stats["items"] == 7
+    assert stats["sections"] == {"tick": 3}
+
+
+def test_frames_are_written_to_the_trace(tmp_path):
+    path = tmp_path / "trace" / "frames.jsonl"
+    profiler = Profiler(trace_fp=str(path), counter=lambda: 5)
+
+    profiler.add("render", 2)
+    profiler.frame(ticks=1)
+    profiler.frame(ticks=2)
+    profiler.close()
+
+    frames = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert [frame["ticks"] for frame in frames] == [1, 2]
+    assert frames[0]["frame_ms"] is None and frames[1]["frame_ms"] >= 0
+    assert frames[0]["sections"] == {"render": 2} and frames[1]["sections"] == {}
+    assert frames[0]["items"] == 5
+
+
+def test_histogram_counts_values_in_their_buckets():
+    histogram = Histogram((1, 5, 10))
+
+    for value in (0.5, 1, 3, 5, 7, 50):
+        histogram.add(value)
+
+    assert histogram.count == 6
+    assert histogram.counts == [2, 2, 1, 1]
+    assert histogram.rows() == [("<= 1", 2), ("<= 5", 2), ("<= 10", 1), ("> 10", 1)]
+
+
+def test_histogram_percentile_is_the_upper_bound_of_the_bucket():
+    histogram = Histogram((1, 5, 10))
+
+    assert histogram.percentile(50) is None
+
+    for value in (2, 3, 4, 8, 100):
+        histogram.add(value)
+
+    assert histogram.percentile(50) == 5
+    assert histogram.percentile(80) == 10
+
+    # The last bucket has no upper bound
+    assert histogram.percentile(100) is None
+
+
+def test_profiler_latency_is_added_to_the_histograms():
+    profiler = Profiler()
+    profiler.addLatency(3, 9)
+
+    assert [profiler.latencies[name].count for name in ("queue", "display", "total")] == [1, 1, 1]
+    assert profiler.stats()["input"] == {"count": 1, "p50": 12, "p99": 12}
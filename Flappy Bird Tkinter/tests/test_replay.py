@@ -0,0 +1,74 @@
+import struct
+
+import pytest
+
+from Policies import policies
+from Replay import Replay
+
+
+def record(seed=11, width=1920, height=1080, tick_rate=60):
+    """ Plays a game with the gap policy, recording it like the game does """
+
+    from random import Random
+
+    replay = Replay(seed, width, height, tick_rate)
+    world = replay.createWorld()
+    rng = Random(0)
+
+    while world.alive and world.ticks < 3000:
+        jump = policies["gap"](world, rng)
+
+        if jump:
+            replay.record(world.ticks)
+
+        world.step(jump)
+
+    replay.finish(world)
+    return replay, world
+
+
+def test_save_and_load_keep_the_replay(tmp_path):
+    # Differences between the jumps that need one, two and three bytes
+    replay = Replay(123, 1920, 1080, 60, jumps=[0, 1, 128, 300, 20000, 20001], score=4, ticks=20002)
+    replay.save(str(tmp_path / "game.replay"))
+
+    loaded = Replay.load(str(tmp_path / "game.replay"))
+
+    assert loaded.jumps == replay.jumps
+    assert (loaded.seed, loaded.width, loaded.height, loaded.tick_rate, loaded.score, loaded.ticks) == \
+        (123, 1920, 1080, 60, 4, 20002)
+
+
+def test_simulate_plays_the_recorded_game(tmp_path):
+    replay, world = record()
+    replay.save(str(tmp_path / "game.replay"))
+
+    simulated = Replay.load(str(tmp_path / "game.replay")).simulate()
+
+    assert world.score > 0
+    assert (simulated.score, simulated.ticks, simulated.alive) == (world.score, world.ticks, world.alive)
+
+
+def test_replay_plays_the_same_in_another_resolution():
+    replay, world = record(width=1920, height=1080)
+    replay.width, replay.height = 1280, 720
+
+    assert replay.simulate().score == world.score
+
+
+def test_load_refuses_other_versions(tmp_path):
+    path = tmp_path / "old.replay"
+    path.write_bytes(struct.pack("<4sBHHHIIII", Replay.magic, 1, 1920, 1080, 60, 0, 0, 0, 0))
+
+    with pytest.raises(ValueError):
+        Replay.load(str(path))
+
+
+def test_jump_at():
+    replay = Replay(0, 1920, 1080, 60)
+    replay.record(3)
+
+    assert replay.jumpAt(3) and not replay.jumpAt(4)
+
+    replay.record(4)
+    assert replay.jumpAt(4)
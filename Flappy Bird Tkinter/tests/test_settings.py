@@ -0,0 +1,44 @@
+import pytest
+
+from Settings import Settings
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    # The settings are attributes of the class, so they are restored after each test
+    for attr in ("tick_rate", "frame_cap", "background_animation", "tube_cache_size", "performance_overlay",
+                 "performance_preset", "high_refresh_rate"):
+        monkeypatch.setattr(Settings, attr, getattr(Settings, attr))
+
+    return Settings()
+
+
+def test_presets_replace_the_settings(settings):
+    settings.applyPreset("low")
+
+    assert (Settings.tick_rate, Settings.frame_cap, Settings.tube_cache_size) == (30, 45, 128)
+    assert Settings.background_animation is False
+    assert Settings.performance_preset == "low"
+
+
+def test_presets_keep_the_overlay(settings):
+    Settings.performance_overlay = True
+
+    for name in Settings.performance_presets:
+        settings.applyPreset(name)
+        assert Settings.performance_overlay
+
+
+def test_frame_rate_of_the_render_modes(settings):
+    Settings.high_refresh_rate = False
+    assert settings.getFrameRate() == Settings.tick_rate
+    assert settings.getFrameRate("medium") == 45
+
+    Settings.high_refresh_rate = True
+    assert settings.getFrameRate() == Settings.frame_cap
+    assert settings.getFrameRate("medium") == 90
+
+
+def test_unknown_presets_are_refused(settings):
+    with pytest.raises(ValueError):
+        settings.applyPreset("ultra")
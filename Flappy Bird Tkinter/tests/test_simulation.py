@@ -0,0 +1,102 @@
+from random import Random
+from time import perf_counter, sleep
+
+import pytest
+
+from Policies import followGap
+from Simulation import Simulation
+from World import World
+
+
+class Bot(object):
+    """ Control function that plays with the gap policy and can stall the thread of the simulation once """
+
+    def __init__(self, stall=0):
+        self.stall = stall
+        self.calls = 0
+        self.__rng = Random(0)
+
+    def __call__(self, world):
+        self.calls += 1
+
+        if self.calls == 1 and self.stall:
+            sleep(self.stall)
+
+        return followGap(world, self.__rng)
+
+
+def createWorld(tick_rate):
+    return World(1920, 1080, tick=1000 / tick_rate, seed=1)
+
+
+def test_snapshots_are_published_in_order():
+    world = createWorld(200)
+    simulation = Simulation(world, Bot(), tick_rate=200)
+    simulation.start()
+    sleep(0.2)
+    simulation.stop()
+
+    snapshots = simulation.poll()
+
+    assert snapshots
+    assert [snapshot.ticks for snapshot in snapshots] == list(range(1, len(snapshots) + 1))
+    assert snapshots[-1].ticks == world.ticks
+    assert simulation.poll() == []
+
+
+def test_late_ticks_are_caught_up_only_up_to_the_limit():
+    # A tick lasts 10 ms and at most 5 late ticks are executed at once
+    bot = Bot(stall=0.5)
+    simulation = Simulation(createWorld(100), bot, tick_rate=100, max_step=0.05)
+    assert simulation.max_catch_up == 5
+
+    start = perf_counter()
+    simulation.start()
+    sleep(0.8)
+    simulation.stop()
+    elapsed = perf_counter() - start
+
+    # Catching up the whole stall would run a tick for every 10 ms since the start
+    assert simulation.poll()[-1].alive
+    assert 5 < bot.calls <= (elapsed - 0.5) * 100 + 5 + 10
+
+
+def test_the_simulation_sleeps_while_paused():
+    bot = Bot()
+    simulation = Simulation(createWorld(100), bot, tick_rate=100)
+    simulation.start()
+    sleep(0.05)
+
+    simulation.pause()
+    sleep(0.05)
+    calls = bot.calls
+    sleep(0.3)
+
+    assert simulation.isPaused()
+    assert bot.calls == calls
+
+    # The time that it was paused is not caught up
+    simulation.resume()
+    sleep(0.1)
+    simulation.stop()
+
+    assert not simulation.isPaused()
+    assert calls < bot.calls <= calls + 15
+
+
+def test_the_thread_ends_when_the_bird_dies():
+    simulation = Simulation(createWorld(1000), lambda world: False, tick_rate=1000)
+    simulation.start()
+    simulation.join(5)
+
+    assert not simulation.is_alive()
+    assert not simulation.poll()[-1].alive
+
+
+def test_needs_valid_arguments():
+    with pytest.raises(TypeError):
+        Simulation(None, lambda world: False)
+    with pytest.raises(TypeError):
+        Simulation(createWorld(60), None)
+    with pytest.raises(ValueError):
+        Simulation(createWorld(60), lambda world: False, tick_rate=0)
@@ -0,0 +1,83 @@
+import pytest
+
+from Soak import Soak
+from World import World
+
+
+class FakeCache(object):
+    size = 32
+
+
+class FakeBackground(object):
+    tubeCache = FakeCache()
+
+
+class FakeApp(object):
+    """ Stands for the App, with only what the checks of the soak use """
+
+    tube_cache_size = 32
+
+    def __init__(self):
+        self.__world = World(1920, 1080)
+
+    def getBackground(self):
+        return FakeBackground()
+
+    def getWorld(self):
+        return self.__world
+
+
+def results(count, **growth):
+    """ Returns the measures of some games, where each measure grows by the given value per game """
+
+    measures = ("rss", "traced", "photo_images", "canvas_items", "widgets", "threads", "tube_images", "pool_items")
+    return [{name: 10 + growth.get(name, 0) * game for name in measures} for game in range(count)]
+
+
+def test_trend_is_the_growth_per_game():
+    assert Soak.trend([5, 5, 5, 5]) == 0
+    assert Soak.trend([0, 2, 4, 6]) == pytest.approx(2)
+    assert Soak.trend([1, 0, 1, 0, 1, 0]) == pytest.approx(-3 / 35)
+
+
+def test_flat_measures_pass():
+    soak = Soak(FakeApp(), games=50, warmup=10)
+    soak.results = results(50)
+
+    assert soak.check() == []
+
+
+def test_growth_after_the_warm_up_fails():
+    soak = Soak(FakeApp(), games=50, warmup=10)
+    soak.results = results(10, photo_images=1) + [dict(result, photo_images=100) for result in results(40)]
+
+    # The images created during the warm-up are not counted
+    assert soak.check() == []
+
+    soak.results[-1]["photo_images"] = 101
+
+    assert len(soak.check()) == 1
+    assert soak.failures[0].startswith("photo_images grew")
+
+
+def test_caches_must_stay_within_their_limits():
+    soak = Soak(FakeApp(), games=20, warmup=5)
+    bounds = soak.bounds()
+    soak.results = results(20)
+
+    assert bounds == {"tube_images": 32, "pool_items": 4 * World(1920, 1080).getMaxTubes()}
+
+    soak.results[0]["pool_items"] = bounds["pool_items"] + 1
+
+    assert soak.check() == ["pool_items reached {} (limit {})".format(bounds["pool_items"] + 1, bounds["pool_items"])]
+
+
+def test_control_ends_long_games():
+    soak = Soak(FakeApp(), policy="idle", max_ticks=5)
+    world = World(1920, 1080)
+
+    while soak.control(world) is False and world.alive:
+        world.step(False)
+
+    assert world.ticks == 5
+    assert (world.alive, world.cause) == (False, "timeout")
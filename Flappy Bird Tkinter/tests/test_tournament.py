@@ -0,0 +1,45 @@
+import pytest
+
+import Tournament as tournament_module
+from Tournament import Tournament, playGame
+
+
+def result(policy, score, ticks=100, jumps=10, cause="tube"):
+    return {"seed": 0, "policy": policy, "score": score, "ticks": ticks, "jumps": jumps, "cause": cause}
+
+
+def test_summarize_groups_the_results_by_policy():
+    summary = Tournament.summarize([
+        result("gap", 4, ticks=300, jumps=20), result("gap", 1, ticks=100, cause="floor"), result("gap", 7),
+        result("idle", 0, ticks=50, jumps=0, cause="floor")
+    ])
+
+    assert summary["gap"] == {
+        "games": 3, "score_mean": 4, "score_median": 4, "score_max": 7, "score_min": 1, "ticks_mean": 500 / 3,
+        "jumps_mean": 40 / 3, "causes": {"tube": 2, "floor": 1}
+    }
+    assert summary["idle"]["games"] == 1
+    assert summary["idle"]["causes"] == {"floor": 1}
+
+
+def test_summarize_without_results():
+    assert Tournament.summarize([]) == {}
+
+
+def test_games_of_the_same_seed_are_the_same(monkeypatch):
+    tournament = Tournament(range(3), ["gap"], max_ticks=2000)
+
+    # Plays the games in this process, as a worker would
+    monkeypatch.setattr(tournament_module, "_courses", {})
+    monkeypatch.setattr(tournament_module, "_settings", {})
+    tournament_module._initWorker(tournament.courses, tournament.settings)
+
+    results = [playGame((seed, "gap")) for seed in tournament.seeds]
+
+    assert results == [playGame((seed, "gap")) for seed in tournament.seeds]
+    assert all(result["ticks"] <= 2000 for result in results)
+
+
+def test_unknown_policies_are_refused():
+    with pytest.raises(ValueError):
+        Tournament(range(3), ["none"])
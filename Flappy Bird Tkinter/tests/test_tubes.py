@@ -0,0 +1,49 @@
+import pytest
+from PIL.Image import new as newImage
+
+from Assets import Assets
+from Tubes import TubeImageCache
+
+
+class FakePhotoImage(object):
+    """ Stands for a PhotoImage, which needs a window of Tk """
+
+    def __init__(self, image=None, width=None, height=None, **kwargs):
+        self.size = (width, height)
+
+    def height(self):
+        return self.size[1]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(Assets, "getPhotoImage", FakePhotoImage)
+    return TubeImageCache(newImage("RGBA", (20, 10)), step=10, size=3)
+
+
+def test_heights_are_rounded_up_to_the_step(cache):
+    assert cache.get(1).height() == 10
+    assert cache.get(10).height() == 10
+    assert cache.get(11).height() == 20
+
+    # Non-positive heights still get the smallest image
+    assert cache.get(-5).height() == 10
+
+
+def test_images_are_shared_by_the_heights_of_a_step(cache):
+    assert cache.get(21) is cache.get(30)
+    assert len(cache) == 1
+
+
+def test_the_least_recently_used_image_is_discarded(cache):
+    first = cache.get(10)
+    second = cache.get(20)
+    cache.get(30)
+
+    # Using the first image keeps it, so the second one is discarded instead
+    assert cache.get(10) is first
+    cache.get(40)
+
+    assert len(cache) == 3
+    assert cache.get(10) is first
+    assert cache.get(20) is not second
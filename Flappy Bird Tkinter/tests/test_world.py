@@ -0,0 +1,137 @@
+from random import Random
+
+import pytest
+
+from Policies import policies
+from World import Snapshot, Tube, World
+
+
+def play(world, policy="gap", max_ticks=3000, seed=0):
+    """ Plays a game with a policy and returns the snapshots of all the ticks """
+
+    rng = Random(seed)
+    snapshots = []
+
+    while world.alive and world.ticks < max_ticks:
+        world.step(policies[policy](world, rng))
+        snapshots.append(world.snapshot())
+
+    return snapshots
+
+
+def test_same_seed_plays_the_same_game():
+    first = play(World(1920, 1080, tick=1000 / 60, seed=7))
+    second = play(World(1920, 1080, tick=1000 / 60, seed=7))
+
+    assert first == second
+
+
+def test_reset_plays_the_same_game_again():
+    world = World(1920, 1080, tick=1000 / 60, seed=3)
+    first = play(world)
+
+    world.reset()
+    assert play(world) == first
+
+
+def test_same_aspect_ratio_plays_the_same_game_in_any_resolution():
+    sizes = ((1280, 720), (1920, 1080), (3840, 2160))
+    games = [play(World(width, height, tick=1000 / 60, seed=5)) for width, height in sizes]
+
+    assert games[0] == games[1] == games[2]
+
+
+def test_size_is_in_world_units():
+    world = World(1280, 720)
+
+    assert (world.width, world.height) == (1920, World.units)
+    assert world.toPixels(world.height) == 720
+    assert world.getPixelSize(world.bird_width, world.bird_height) == (76, 73)
+
+
+def test_jump_moves_the_bird_up():
+    world = World(1920, 1080, tick=1000 / 60, seed=1)
+    world.step(True)
+
+    assert world.bird_y < world.previous_y
+
+
+def test_dead_world_does_not_move():
+    world = World(1920, 1080, tick=1000 / 60, seed=1)
+
+    while world.alive:
+        world.step(False)
+
+    snapshot = world.snapshot()
+
+    assert world.cause == "floor"
+    assert world.step(True) is False
+    assert world.snapshot() == snapshot
+
+
+def test_score_counts_the_tubes_passed():
+    world = World(1920, 1080, tick=1000 / 60, seed=2)
+    rng = Random(0)
+    passed = 0
+
+    while world.alive and world.ticks < 6000:
+        passed += world.step(policies["gap"](world, rng))
+
+    assert world.score == passed > 0
+    assert all(tube.scored for tube in world.tubes if world.tubeX(tube) < world.bird_x - world.tube_width)
+
+
+def test_tubes_never_exceed_the_maximum():
+    world = World(1920, 1080, tick=1000 / 60, seed=4)
+    rng = Random(0)
+    most = 0
+
+    while world.alive and world.ticks < 6000:
+        world.step(policies["gap"](world, rng))
+        most = max(most, len(world.tubes))
+
+    assert 0 < most <= world.getMaxTubes()
+
+
+def test_course_sets_the_heights_of_the_tubes():
+    course = (300, 400, 500)
+    world = World(1920, 1080, tick=1000 / 60, course=course)
+    rng = Random(0)
+    heights = []
+
+    while world.alive and len(heights) < 3:
+        world.step(policies["gap"](world, rng))
+
+        if world.tubes and world.tubes[-1].height not in heights:
+            heights.append(world.tubes[-1].height)
+
+    assert tuple(heights) == course
+
+
+def test_snapshot_is_a_copy():
+    world = World(1920, 1080, tick=1000 / 60, seed=1)
+    rng = Random(0)
+
+    while world.alive and not world.tubes:
+        world.step(policies["gap"](world, rng))
+
+    snapshot = world.snapshot(1.5, 0.2)
+    world.step(False)
+
+    assert isinstance(snapshot, Snapshot)
+    assert (snapshot.time, snapshot.step_time) == (1.5, 0.2)
+    assert snapshot.ticks == world.ticks - 1
+    assert snapshot.tubes[0].offset == world.tubes[0].offset
+    assert snapshot.distance < world.distance
+
+
+def test_distance_between_two_ticks():
+    world = World(1920, 1080, tick=1000 / 60, seed=1)
+    world.step(False)
+    world.step(False)
+    snapshot = world.snapshot()
+
+    assert world.distanceAt(0) == snapshot.distanceAt(0) == world.previous_distance
+    assert world.distanceAt() == snapshot.distanceAt() == world.distance
+    assert snapshot.distanceAt(0.5) == pytest.approx(world.distance - world.tube_speed / 2)
+    assert world.tubeX(Tube(world.distance + 100, 0, 0), 0.5) == pytest.approx(100 + world.tube_speed / 2)